@@ -154,6 +154,7 @@ class WebServerAPI(QObject):
                         success=False,
                         message="No screenshots available. Upload screenshot data or take screenshots in the GUI."
                     )
+                self.screenshot_manager.wait_for_pending_saves()
                 screenshot_paths = [s["file_path"] for s in all_screenshots]
             
             if not screenshot_paths:
@@ -366,7 +367,7 @@ class WebServerAPI(QObject):
                 )
             
             # Get current screenshot count before triggering
-            current_count = len(self.screenshot_manager.get_all_screenshots())
+            current_count = self.screenshot_manager.screenshot_count()
             
             # Emit signal to trigger screenshot in GUI
             self.screenshot_capture_requested.emit()
@@ -632,8 +633,7 @@ class WebServerAPI(QObject):
             # Check if there are screenshots available
             has_screenshots = False
             if self.gui_connected and self.screenshot_manager:
-                screenshots = self.screenshot_manager.get_all_screenshots()
-                has_screenshots = len(screenshots) > 0
+                has_screenshots = self.screenshot_manager.screenshot_count() > 0
             
             # Get current language
             from interview_corvus.config import settings
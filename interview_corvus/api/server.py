@@ -30,7 +30,14 @@ if TYPE_CHECKING:
 
 
 class WebServerThread(QThread):
-    """Thread to run the FastAPI server."""
+    """
+    Thread to run the FastAPI server.
+
+    The server keeps its own thread and asyncio loop rather than sharing the
+    Qt event loop: route handlers call the LLM service synchronously, so
+    serving them on the GUI thread would freeze the window for the duration
+    of every generation request.
+    """
     
     def __init__(self, api_instance: WebServerAPI, host: str = "0.0.0.0", port: int = 8000):
         super().__init__()
@@ -38,6 +45,7 @@ class WebServerThread(QThread):
         self.host = host
         self.port = port
         self.app = self._create_app()
+        self.server = None
     
     def _create_app(self) -> FastAPI:
         """Create the FastAPI application."""
@@ -74,13 +82,32 @@ class WebServerThread(QThread):
             print("  DELETE /history              - Reset history")
             print("=" * 60)
             
-            uvicorn.run(
+            config = uvicorn.Config(
                 self.app,
                 host=self.host,
                 port=self.port,
                 log_level="warning",  # Only show warnings and errors, no access logs
                 access_log=False      # Disable HTTP access logging
             )
+            self.server = uvicorn.Server(config)
+            self.server.run()
         except Exception as e:
             logger.error(f"❌ Failed to start web server: {e}")
             print(f"❌ Failed to start web server: {e}")
+    
+    def stop(self, timeout_ms: int = 3000):
+        """
+        Ask the server to shut down and wait for the thread to finish.
+        
+        Falls back to terminate() only if uvicorn has not exited in time.
+        
+        Args:
+            timeout_ms: How long to wait for a graceful shutdown
+        """
+        if self.server is not None:
+            # Polled by uvicorn's main loop, so this is safe from another thread
+            self.server.should_exit = True
+        if not self.wait(timeout_ms):
+            logger.warning("Web server did not stop in time, terminating thread")
+            self.terminate()
+            self.wait()
@@ -34,6 +34,8 @@ class UISettings(BaseSettings):
         default_factory=lambda: {"width": 600, "height": 400}
     )
     always_on_top: bool = False  # Default to always on top
+    # Code lines longer than this are left unhighlighted to keep the UI responsive
+    max_highlight_line_length: int = 10_000
     model_config = SettingsConfigDict(env_prefix="INTERVIEW_CORVUS_UI_")
 
 
@@ -333,11 +335,9 @@ class Settings(BaseSettings):
         env_prefix="INTERVIEW_CORVUS_",
     )
 
-    def save_user_settings(self):
-        """Save user-specific settings to a JSON file."""
-        settings_path = self.app_data_dir / "user_settings.json"
-
-        user_settings = {
+    def user_settings_snapshot(self) -> dict:
+        """Collect the user-specific settings that are persisted to JSON."""
+        return {
             "default_language": self.default_language,
             "llm": {
                 "model": self.llm.model,
@@ -353,17 +353,21 @@ class Settings(BaseSettings):
                 "screenshot_key": self.hotkeys.screenshot_key,
                 "generate_solution_key": self.hotkeys.generate_solution_key,
                 "toggle_visibility_key": self.hotkeys.toggle_visibility_key,
-                "move_window_keys": self.hotkeys.move_window_keys,
+                "move_window_keys": dict(self.hotkeys.move_window_keys),
                 "optimize_solution_key": self.hotkeys.optimize_solution_key,
                 "reset_history_key": self.hotkeys.reset_history_key,
                 "panic_key": self.hotkeys.panic_key,
             },
-            "prompts": {"templates": self.prompts.templates},
+            "prompts": {"templates": dict(self.prompts.templates)},
         }
 
+    def save_user_settings(self):
+        """Save user-specific settings to a JSON file."""
+        settings_path = self.app_data_dir / "user_settings.json"
+
         # Save to JSON
         with open(settings_path, "w") as f:
-            json.dump(user_settings, f, indent=2)
+            json.dump(self.user_settings_snapshot(), f, indent=2)
 
     def load_user_settings(self):
         """Load user-specific settings from a JSON file."""
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from loguru import logger
 from pynput import keyboard
 from PyQt6.QtCore import QEvent, QObject, pyqtBoundSignal, pyqtSignal
@@ -6,6 +8,12 @@ from PyQt6.QtGui import QKeySequence, QShortcut
 from interview_corvus.config import settings
 
 
+@lru_cache(maxsize=32)
+def _key_sequence(text: str) -> QKeySequence:
+    """Parse a hotkey string once; re-registration reuses the result."""
+    return QKeySequence(text)
+
+
 class HotkeyManager(QObject):
     """
     Manager for registering and handling global hotkeys.
@@ -167,11 +175,16 @@ class HotkeyManager(QObject):
                 dir
             )
 
-        # Register local shortcuts through PyQt
+        # Register local shortcuts through PyQt. The old shortcuts are parented
+        # to the window, so dropping our references alone would leave them
+        # firing alongside the new ones.
+        for shortcut in self.shortcuts:
+            shortcut.setParent(None)
+            shortcut.deleteLater()
         self.shortcuts.clear()
 
         for key_sequence, signal in self.hotkeys.items():
-            shortcut = QShortcut(QKeySequence(key_sequence), window)
+            shortcut = QShortcut(_key_sequence(key_sequence), window)
 
             def create_callback(sig):
                 return lambda: sig.emit() if isinstance(sig, pyqtBoundSignal) else sig()
@@ -278,7 +291,7 @@ class HotkeyManager(QObject):
         """Handler for key press events from pynput."""
         try:
             # Debug the incoming key
-            logger.info(f"Key pressed: {key}, type: {type(key)}")
+            logger.debug("Key pressed: {}, type: {}", key, type(key))
 
             # Normalize modifier keys - map specific variants to base forms
             modifier_map = {
@@ -296,23 +309,23 @@ class HotkeyManager(QObject):
             if key in modifier_map:
                 normalized_key = modifier_map[key]
                 self.current_keys.add(normalized_key)
-                logger.info(f"Added normalized modifier key: {normalized_key} (from {key})")
+                logger.debug("Added normalized modifier key: {} (from {})", normalized_key, key)
 
             # If it's a regular key we care about
             elif key in self.keys_of_interest:
                 self.current_keys.add(key)
-                logger.info(f"Added key of interest: {key}")
+                logger.debug("Added key of interest: {}", key)
 
             # For character keys, match by character value
             elif hasattr(key, "char") and key.char:
                 for k in self.keys_of_interest:
                     if hasattr(k, "char") and k.char and k.char.lower() == key.char.lower():
                         self.current_keys.add(k)
-                        logger.info(f"Added character key: {k} (matched with {key})")
+                        logger.debug("Added character key: {} (matched with {})", k, key)
                         break
 
             # Log current keys after adding
-            logger.info(f"Current keys: {self.current_keys}")
+            logger.debug("Current keys: {}", self.current_keys)
 
             # Simple hotkey matching - check each registered combination
             for hotkey_set, signal in self.pynput_hotkeys.items():
@@ -360,7 +373,7 @@ class HotkeyManager(QObject):
     def on_key_release(self, key):
         """Handler for key release events from pynput."""
         try:
-            logger.info(f"Key released: {key}")
+            logger.debug("Key released: {}", key)
 
             # For direct matches - this works for most keys
             key_removed = False
@@ -370,7 +383,7 @@ class HotkeyManager(QObject):
                 if k == key:
                     self.current_keys.remove(k)
                     key_removed = True
-                    logger.info(f"Removed key by direct match: {k}")
+                    logger.debug("Removed key by direct match: {}", k)
                     break
 
             # If no direct match found, try character comparison
@@ -379,11 +392,11 @@ class HotkeyManager(QObject):
                     if hasattr(k, "char") and k.char and k.char.lower() == key.char.lower():
                         self.current_keys.remove(k)
                         key_removed = True
-                        logger.info(f"Removed key by character match: {k}")
+                        logger.debug("Removed key by character match: {}", k)
                         break
 
             # Log remaining keys
-            logger.info(f"Current keys after release: {self.current_keys}")
+            logger.debug("Current keys after release: {}", self.current_keys)
             
         except Exception as e:
             logger.error(f"Error in on_key_release: {e}")
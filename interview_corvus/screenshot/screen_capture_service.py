@@ -1,13 +1,35 @@
 from datetime import datetime
 from typing import Dict, List, Tuple
 
-from PyQt6.QtCore import QRect
-from PyQt6.QtGui import QPixmap
+from loguru import logger
+from PyQt6.QtCore import QRect, QRunnable, QThreadPool
+from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import QApplication
 
 from interview_corvus.config import settings
 
 
+class _SaveImageTask(QRunnable):
+    """Encode a captured image as PNG and write it to disk."""
+
+    def __init__(self, image: QImage, file_path: str):
+        """
+        Initialize the save task.
+
+        Args:
+            image: The captured image
+            file_path: Destination path of the PNG file
+        """
+        super().__init__()
+        self.image = image
+        self.file_path = file_path
+
+    def run(self):
+        """Write the image; runs on a worker thread."""
+        if not self.image.save(self.file_path, "PNG"):
+            logger.error(f"Failed to save screenshot to {self.file_path}")
+
+
 class ScreenCaptureService:
     """Service for capturing screenshots of the screen."""
 
@@ -17,6 +39,10 @@ class ScreenCaptureService:
         self.screenshots_dir = settings.app_data_dir / "screenshots"
         self.screenshots_dir.mkdir(exist_ok=True)
 
+        # PNG encoding happens off the GUI thread; one worker keeps writes ordered
+        self.save_pool = QThreadPool()
+        self.save_pool.setMaxThreadCount(1)
+
     def get_available_screens(self) -> List[Dict[str, any]]:
         """
         Get a list of all available screens.
@@ -108,6 +134,9 @@ class ScreenCaptureService:
         """
         Save a screenshot to a file.
 
+        The file is written asynchronously; call wait_for_pending_saves
+        before reading it back.
+
         Args:
             pixmap: The screenshot pixmap
 
@@ -117,5 +146,10 @@ class ScreenCaptureService:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         file_path = str(self.screenshots_dir / f"screenshot_{timestamp}.png")
 
-        pixmap.save(file_path, "PNG")
+        # QPixmap is GUI-thread only, so hand the worker a QImage copy
+        self.save_pool.start(_SaveImageTask(pixmap.toImage(), file_path))
         return file_path, pixmap
+
+    def wait_for_pending_saves(self) -> None:
+        """Block until every queued screenshot has been written to disk."""
+        self.save_pool.waitForDone()
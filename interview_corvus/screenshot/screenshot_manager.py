@@ -1,5 +1,7 @@
 from typing import Dict, List, Optional
 
+from PyQt6.QtCore import QSize, Qt
+
 from interview_corvus.screenshot.screen_capture_service import ScreenCaptureService
 
 
@@ -9,6 +11,9 @@ class ScreenshotManager:
     Maintains up to 10 screenshots at a time.
     """
 
+    # Size of the preview pixmap rendered once per capture
+    THUMBNAIL_SIZE = QSize(150, 120)
+
     def __init__(self):
         """Initialize the screenshot manager."""
         self.capture_service = ScreenCaptureService()
@@ -72,9 +77,17 @@ class ScreenshotManager:
         """
         Add a screenshot to the managed list, removing oldest if necessary.
 
+        The thumbnail is scaled here, once, so the UI never rescales the
+        full-resolution pixmap.
+
         Args:
             screenshot_info: Dictionary with screenshot information
         """
+        screenshot_info["thumb_pixmap"] = screenshot_info["pixmap"].scaled(
+            self.THUMBNAIL_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
         if len(self.screenshots) >= self.max_screenshots:
             self.screenshots.pop(0)
         self.screenshots.append(screenshot_info)
@@ -107,6 +120,19 @@ class ScreenshotManager:
         """
         return self.screenshots
 
+    def screenshot_count(self) -> int:
+        """
+        Get the number of current screenshots.
+
+        Returns:
+            Number of screenshots held by the manager
+        """
+        return len(self.screenshots)
+
+    def wait_for_pending_saves(self) -> None:
+        """Block until all captured screenshots have been written to disk."""
+        self.capture_service.wait_for_pending_saves()
+
     def clear_screenshots(self) -> None:
         """Clear all screenshots."""
         self.screenshots = []
@@ -1 +1,21 @@
 """UI Components for the Interview Corvus application."""
+
+from functools import lru_cache
+from importlib.util import find_spec
+
+
+@lru_cache(maxsize=None)
+def web_server_available() -> bool:
+    """
+    Check once whether the optional web API can be used.
+    
+    Shared by the main window and the components so they always agree.
+    """
+    # Cheap check first: the server module exits outright if fastapi/uvicorn are missing
+    if any(find_spec(name) is None for name in ("fastapi", "uvicorn")):
+        return False
+    try:
+        import interview_corvus.api.web_server  # noqa: F401
+    except ImportError:
+        return False
+    return True
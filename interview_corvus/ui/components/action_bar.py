@@ -8,6 +8,7 @@ from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QSizePolicy
 
 from interview_corvus.config import settings
+from interview_corvus.ui.components import web_server_available
 
 
 class ActionBar(QWidget):
@@ -23,6 +24,15 @@ class ActionBar(QWidget):
     visibility_toggle_requested = pyqtSignal()
     web_server_toggle_requested = pyqtSignal()
     
+    # (button attribute, tooltip label, settings.hotkeys field)
+    _HOTKEY_TOOLTIPS = (
+        ("screenshot_button", "Take Screenshot", "screenshot_key"),
+        ("generate_button", "Generate Solution", "generate_solution_key"),
+        ("optimize_button", "Optimize Solution", "optimize_solution_key"),
+        ("reset_button", "Reset All", "reset_history_key"),
+        ("visibility_button", "Toggle Visibility", "toggle_visibility_key"),
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_ui()
@@ -36,18 +46,15 @@ class ActionBar(QWidget):
         
         # Main action buttons
         self.screenshot_button = QPushButton("📸 Capture")
-        self.screenshot_button.setToolTip(f"Take Screenshot ({settings.hotkeys.screenshot_key})")
         self.screenshot_button.setFixedSize(90, 35)
         layout.addWidget(self.screenshot_button)
         
         self.generate_button = QPushButton("🚀 Solve")
-        self.generate_button.setToolTip(f"Generate Solution ({settings.hotkeys.generate_solution_key})")
         self.generate_button.setFixedSize(90, 35)
         self.generate_button.setEnabled(False)  # Initially disabled until screenshots are available
         layout.addWidget(self.generate_button)
         
         self.optimize_button = QPushButton("⚡ Optimize")
-        self.optimize_button.setToolTip(f"Optimize Solution ({settings.hotkeys.optimize_solution_key})")
         self.optimize_button.setFixedSize(90, 35)
         self.optimize_button.setEnabled(False)  # Initially disabled until solution is generated
         layout.addWidget(self.optimize_button)
@@ -60,7 +67,6 @@ class ActionBar(QWidget):
         
         reset_button = QPushButton("🔄 Reset")
         reset_button.setFixedSize(85, 35)
-        reset_button.setToolTip(f"Reset All ({settings.hotkeys.reset_history_key})")
         layout.addWidget(reset_button)
         self.reset_button = reset_button
         
@@ -76,19 +82,20 @@ class ActionBar(QWidget):
         
         self.visibility_button = QPushButton("👁️ Hide")
         self.visibility_button.setFixedSize(70, 32)
-        self.visibility_button.setToolTip(f"Toggle Visibility ({settings.hotkeys.toggle_visibility_key})")
         layout.addWidget(self.visibility_button)
         
         # Web server button (optional)
-        try:
-            from interview_corvus.api.web_server import create_integrated_web_server
+        if web_server_available():
             self.web_server_button = QPushButton("🌐 API")
             self.web_server_button.setFixedSize(70, 32)
             self.web_server_button.setToolTip("Toggle Web API Server")
             layout.addWidget(self.web_server_button)
-        except ImportError:
+        else:
             self.web_server_button = None
         
+        # Hotkey tooltips
+        self.update_button_texts()
+        
         # Set the layout to the widget and ensure proper sizing
         self.setLayout(layout)
         self.setMinimumHeight(40)  # Ensure minimum height for buttons
@@ -132,7 +139,6 @@ class ActionBar(QWidget):
         
     def update_button_texts(self):
         """Update button tooltips to reflect current hotkey settings."""
-        self.screenshot_button.setToolTip(f"Take Screenshot ({settings.hotkeys.screenshot_key})")
-        self.generate_button.setToolTip(f"Generate Solution ({settings.hotkeys.generate_solution_key})")
-        self.optimize_button.setToolTip(f"Optimize Solution ({settings.hotkeys.optimize_solution_key})")
-        self.visibility_button.setToolTip(f"Toggle Visibility ({settings.hotkeys.toggle_visibility_key})")
+        hotkeys = settings.hotkeys
+        for attr, label, key_field in self._HOTKEY_TOOLTIPS:
+            getattr(self, attr).setToolTip(f"{label} ({getattr(hotkeys, key_field)})")
@@ -3,77 +3,188 @@ Content Display Component.
 Contains the code editor and explanation display areas.
 """
 
-import re
+from enum import IntEnum
+
 from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel, QSplitter,
     QPlainTextEdit, QTextEdit
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QRegularExpression, QSignalBlocker, QTimer, pyqtSignal
 from PyQt6.QtGui import (
     QFont, QSyntaxHighlighter, QTextCharFormat, 
     QTextDocument, QColor
 )
 from loguru import logger
 
+from interview_corvus.config import settings
+
+
+# Resolved on first use; the font database needs a running QApplication
+_CODE_FONT = None
+
+
+def get_code_font() -> QFont:
+    """Return the monospace font for code views, probing fallbacks once."""
+    global _CODE_FONT
+    if _CODE_FONT is None:
+        for family in ("Fira Code", "JetBrains Mono", "Consolas", "Monaco"):
+            font = QFont(family, 11)
+            if font.exactMatch():
+                break
+        else:
+            font = QFont("monospace", 11)
+            font.setStyleHint(QFont.StyleHint.Monospace)
+        _CODE_FONT = font
+    return _CODE_FONT
+
+
+class TokenKind(IntEnum):
+    """Token categories produced by the Python highlighter."""
+    
+    KEYWORD = 0
+    STRING = 1
+    COMMENT = 2
+    NUMBER = 3
+    FUNCTION = 4
+    CLASS = 5
+
+
+def _make_format(color: QColor, bold: bool = False, italic: bool = False) -> QTextCharFormat:
+    """Build a character format for one token kind."""
+    fmt = QTextCharFormat()
+    fmt.setForeground(color)
+    if bold:
+        fmt.setFontWeight(QFont.Weight.Bold)
+    if italic:
+        fmt.setFontItalic(True)
+    return fmt
+
+
+# One shared format per token kind, created once for every highlighter
+TOKEN_FORMATS = {
+    TokenKind.KEYWORD: _make_format(QColor(86, 156, 214), bold=True),  # Blue
+    TokenKind.STRING: _make_format(QColor(206, 145, 120)),  # Orange
+    TokenKind.COMMENT: _make_format(QColor(106, 153, 85), italic=True),  # Green
+    TokenKind.NUMBER: _make_format(QColor(181, 206, 168)),  # Light green
+    TokenKind.FUNCTION: _make_format(QColor(220, 220, 170)),  # Yellow
+    TokenKind.CLASS: _make_format(QColor(78, 201, 176), bold=True),  # Cyan
+}
+
+PYTHON_KEYWORDS = frozenset([
+    'and', 'as', 'assert', 'break', 'class', 'continue', 'def',
+    'del', 'elif', 'else', 'except', 'exec', 'finally', 'for',
+    'from', 'global', 'if', 'import', 'in', 'is', 'lambda',
+    'not', 'or', 'pass', 'print', 'raise', 'return', 'try',
+    'while', 'with', 'yield', 'None', 'True', 'False'
+])
+
+# Single left-to-right tokenizer. Alternatives are ordered by priority
+# (comment, strings, def/class names, identifiers, numbers) so each
+# character is claimed by exactly one token and strings inside
+# comments (or vice versa) are never formatted twice. The string forms
+# are escape-aware character classes, which cannot backtrack across the
+# whole line. Identifiers are matched generically and classified as
+# keywords by a set lookup, which is cheaper than a 34-way alternation.
+_TOKEN_PATTERN = (
+    r'(?P<comment>#.*)'
+    r'|(?P<string_dq>"[^"\\\n]*(?:\\.[^"\\\n]*)*")'
+    r"|(?P<string_sq>'[^'\\\n]*(?:\\.[^'\\\n]*)*')"
+    r'|(?P<defname>(?<=\bdef )\w+)'
+    r'|(?P<clsname>(?<=\bclass )\w+)'
+    r'|(?P<ident>\b[A-Za-z_]\w*\b)'
+    r'|(?P<number>\b\d+\b)'
+)
+
+# Named groups of _TOKEN_PATTERN, in priority order
+_GROUP_KINDS = (
+    ('comment', TokenKind.COMMENT),
+    ('string_dq', TokenKind.STRING),
+    ('string_sq', TokenKind.STRING),
+    ('defname', TokenKind.FUNCTION),
+    ('clsname', TokenKind.CLASS),
+    ('ident', TokenKind.KEYWORD),
+    ('number', TokenKind.NUMBER),
+)
+
 
 class PythonSyntaxHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for Python code."""
     
+    # QRegularExpression keeps matching on the C++ side (PCRE2 with JIT), so
+    # highlightBlock does not round-trip every block through Python re. The
+    # pattern is compiled once and shared by every highlighter instance.
+    token_pattern = QRegularExpression(_TOKEN_PATTERN)
+    
+    # Number of deferred blocks highlighted per idle step
+    DEFERRED_CHUNK_SIZE = 200
+    
     def __init__(self, document: QTextDocument):
         super().__init__(document)
         
-        # Define highlighting rules
-        self.highlighting_rules = []
-        
-        # Keyword format
-        keyword_format = QTextCharFormat()
-        keyword_format.setForeground(QColor(86, 156, 214))  # Blue
-        keyword_format.setFontWeight(QFont.Weight.Bold)
-        keywords = [
-            'and', 'as', 'assert', 'break', 'class', 'continue', 'def',
-            'del', 'elif', 'else', 'except', 'exec', 'finally', 'for',
-            'from', 'global', 'if', 'import', 'in', 'is', 'lambda',
-            'not', 'or', 'pass', 'print', 'raise', 'return', 'try',
-            'while', 'with', 'yield', 'None', 'True', 'False'
-        ]
-        for keyword in keywords:
-            pattern = f'\\b{keyword}\\b'
-            self.highlighting_rules.append((re.compile(pattern), keyword_format))
-        
-        # String format
-        string_format = QTextCharFormat()
-        string_format.setForeground(QColor(206, 145, 120))  # Orange
-        self.highlighting_rules.append((re.compile(r'".*?"'), string_format))
-        self.highlighting_rules.append((re.compile(r"'.*?'"), string_format))
-        
-        # Comment format
-        comment_format = QTextCharFormat()
-        comment_format.setForeground(QColor(106, 153, 85))  # Green
-        comment_format.setFontItalic(True)
-        self.highlighting_rules.append((re.compile(r'#.*'), comment_format))
-        
-        # Number format
-        number_format = QTextCharFormat()
-        number_format.setForeground(QColor(181, 206, 168))  # Light green
-        self.highlighting_rules.append((re.compile(r'\\b\\d+\\b'), number_format))
-        
-        # Function format
-        function_format = QTextCharFormat()
-        function_format.setForeground(QColor(220, 220, 170))  # Yellow
-        self.highlighting_rules.append((re.compile(r'\\bdef\\s+(\\w+)'), function_format))
-        
-        # Class format
-        class_format = QTextCharFormat()
-        class_format.setForeground(QColor(78, 201, 176))  # Cyan
-        class_format.setFontWeight(QFont.Weight.Bold)
-        self.highlighting_rules.append((re.compile(r'\\bclass\\s+(\\w+)'), class_format))
+        self.max_line_length = settings.ui.max_highlight_line_length
+        # Blocks from this number on are skipped until highlight_deferred_blocks
+        self._deferred_from = None
+        # Bumped on every deferral so stale idle chunks stop early
+        self._deferred_generation = 0
+        
+    def defer_blocks_from(self, block_number: int):
+        """Skip highlighting of blocks at or after block_number for now."""
+        self._deferred_from = block_number
+        self._deferred_generation += 1
+        
+    def highlight_deferred_blocks(self):
+        """Highlight the blocks skipped by defer_blocks_from in idle-time chunks."""
+        if self._deferred_from is None:
+            return
+        self._schedule_chunk(self._deferred_from, self._deferred_generation)
+        self._deferred_from = None
+        
+    def _schedule_chunk(self, block_number: int, generation: int):
+        """Queue highlighting of the next deferred chunk for when the UI is idle."""
+        QTimer.singleShot(0, lambda: self._highlight_chunk(block_number, generation))
+        
+    def _highlight_chunk(self, block_number: int, generation: int):
+        """Highlight one chunk of deferred blocks and schedule the next."""
+        if generation != self._deferred_generation or self.document() is None:
+            return
+        block = self.document().findBlockByNumber(block_number)
+        for _ in range(self.DEFERRED_CHUNK_SIZE):
+            if not block.isValid():
+                return
+            self.rehighlightBlock(block)
+            block = block.next()
+        if block.isValid():
+            self._schedule_chunk(block.blockNumber(), generation)
         
     def highlightBlock(self, text: str):
         """Apply syntax highlighting to a block of text."""
-        for pattern, fmt in self.highlighting_rules:
-            for match in pattern.finditer(text):
-                start, end = match.span()
-                self.setFormat(start, end - start, fmt)
+        if len(text) > self.max_line_length:
+            return
+        if self._deferred_from is not None and self.currentBlock().blockNumber() >= self._deferred_from:
+            return
+        
+        # Tokens arrive in order; adjacent tokens of the same kind are merged
+        # so each run costs a single setFormat call.
+        span_start = span_end = 0
+        span_kind = None
+        matches = self.token_pattern.globalMatch(text)
+        while matches.hasNext():
+            match = matches.next()
+            for name, kind in _GROUP_KINDS:
+                if match.capturedLength(name):
+                    break
+            if name == 'ident' and match.captured() not in PYTHON_KEYWORDS:
+                continue
+            start = match.capturedStart()
+            if kind == span_kind and start == span_end:
+                span_end = match.capturedEnd()
+                continue
+            if span_kind is not None:
+                self.setFormat(span_start, span_end - span_start, TOKEN_FORMATS[span_kind])
+            span_start, span_end, span_kind = start, match.capturedEnd(), kind
+        
+        if span_kind is not None:
+            self.setFormat(span_start, span_end - span_start, TOKEN_FORMATS[span_kind])
 
 
 class ContentDisplay(QWidget):
@@ -133,16 +244,10 @@ class ContentDisplay(QWidget):
         self.code_editor = QPlainTextEdit()
         self.code_editor.setReadOnly(True)
         
-        # Set font
-        font = QFont("Fira Code", 11)
-        if not font.exactMatch():
-            font = QFont("Consolas", 11)
-        if not font.exactMatch():
-            font = QFont("Monaco", 11)
-        self.code_editor.setFont(font)
+        self.code_editor.setFont(get_code_font())
         
-        # Set up syntax highlighting
-        self.syntax_highlighter = PythonSyntaxHighlighter(self.code_editor.document())
+        # Syntax highlighting is installed on first non-empty code (see _set_code)
+        self.syntax_highlighter = None
         self.code_editor.setPlaceholderText("Generated code will appear here...")
         
         code_layout.addWidget(self.code_editor)
@@ -209,53 +314,85 @@ class ContentDisplay(QWidget):
         # Handle different solution types
         if hasattr(solution, 'code'):
             # CodeSolution
-            self.code_editor.setPlainText(solution.code)
-            self.explanation_text.setMarkdown(solution.explanation)
-            self.time_complexity.setText(solution.time_complexity)
-            self.space_complexity.setText(solution.space_complexity)
+            code = solution.code
+            explanation = solution.explanation
+            time_complexity = solution.time_complexity
+            space_complexity = solution.space_complexity
         elif hasattr(solution, 'solution'):
             # McqSolution
-            self.code_editor.setPlainText("")  # No code for MCQ
-            self.explanation_text.setMarkdown(solution.solution)
-            self.time_complexity.setText("N/A")
-            self.space_complexity.setText("N/A")
+            code = ""  # No code for MCQ
+            explanation = solution.solution
+            time_complexity = space_complexity = "N/A"
         else:
             # Fallback for unknown solution types
             logger.warning(f"Unknown solution type: {type(solution)}")
             if hasattr(solution, '__dict__'):
-                solution_text = str(solution.__dict__)
+                code = str(solution.__dict__)
             else:
-                solution_text = str(solution)
-            self.code_editor.setPlainText(solution_text)
-            self.explanation_text.setMarkdown("")
-            self.time_complexity.setText("N/A")
-            self.space_complexity.setText("N/A")
+                code = str(solution)
+            explanation = ""
+            time_complexity = space_complexity = "N/A"
         
-        self._is_optimized = False
-        self.save_session_data()
+        self._show_result(code, explanation, time_complexity, space_complexity, False)
         
     def display_optimization(self, optimization):
         """Display an optimization result."""
-        self.code_editor.setPlainText(optimization.optimized_code)
-        
         # Create detailed explanation including improvements
-        detailed_explanation = "## Optimization Details\\n\\n"
-        detailed_explanation += optimization.explanation + "\\n\\n"
-        detailed_explanation += "## Improvements\\n\\n"
-        for improvement in optimization.improvements:
-            detailed_explanation += f"- {improvement}\\n"
-        detailed_explanation += "\\n\\n## Time Complexity\\n\\n"
-        detailed_explanation += f"**Original:** {optimization.original_time_complexity}\\n\\n"
-        detailed_explanation += f"**Optimized:** {optimization.optimized_time_complexity}\\n\\n"
-        detailed_explanation += "## Space Complexity\\n\\n"
-        detailed_explanation += f"**Original:** {optimization.original_space_complexity}\\n\\n"
-        detailed_explanation += f"**Optimized:** {optimization.optimized_space_complexity}\\n"
-        
-        self.explanation_text.setMarkdown(detailed_explanation)
-        self.time_complexity.setText(optimization.optimized_time_complexity)
-        self.space_complexity.setText(optimization.optimized_space_complexity)
-        self._is_optimized = True
-        self.save_session_data()
+        improvements = "\n".join(f"- {improvement}" for improvement in optimization.improvements)
+        detailed_explanation = (
+            f"## Optimization Details\n\n{optimization.explanation}\n\n"
+            f"## Improvements\n\n{improvements}\n\n"
+            f"## Time Complexity\n\n"
+            f"**Original:** {optimization.original_time_complexity}\n\n"
+            f"**Optimized:** {optimization.optimized_time_complexity}\n\n"
+            f"## Space Complexity\n\n"
+            f"**Original:** {optimization.original_space_complexity}\n\n"
+            f"**Optimized:** {optimization.optimized_space_complexity}\n"
+        )
+        
+        self._show_result(
+            optimization.optimized_code,
+            detailed_explanation,
+            optimization.optimized_time_complexity,
+            optimization.optimized_space_complexity,
+            True,
+        )
+        
+    def _show_result(self, code, explanation_md, time_complexity, space_complexity, is_optimized):
+        """Push a result into the widgets and record it as the session."""
+        self._set_code(code)
+        self.explanation_text.setMarkdown(explanation_md)
+        self.time_complexity.setText(time_complexity)
+        self.space_complexity.setText(space_complexity)
+        self._is_optimized = is_optimized
+        self._update_session_from_values(
+            code, explanation_md, time_complexity, space_complexity, is_optimized
+        )
+        
+    def _set_code(self, code: str):
+        """
+        Set the editor text, installing the highlighter on first real code.
+        
+        Programmatic updates do not emit code_changed: every caller records
+        the session itself, so a re-read of the editor would be wasted work.
+        """
+        with QSignalBlocker(self.code_editor):
+            if self.syntax_highlighter is None:
+                if not code.strip():
+                    self.code_editor.setPlainText(code)
+                    return
+                self.syntax_highlighter = PythonSyntaxHighlighter(self.code_editor.document())
+            
+            # Only the blocks that fit in the viewport are highlighted while the
+            # text is replaced; the rest are coloured in chunks once the UI is idle.
+            self.syntax_highlighter.defer_blocks_from(self._visible_block_count())
+            self.code_editor.setPlainText(code)
+            self.syntax_highlighter.highlight_deferred_blocks()
+        
+    def _visible_block_count(self) -> int:
+        """Estimate how many blocks fit in the code editor viewport."""
+        line_height = max(self.code_editor.fontMetrics().lineSpacing(), 1)
+        return self.code_editor.viewport().height() // line_height + 1
         
     def get_current_code(self):
         """Get the current code from the editor."""
@@ -263,15 +400,34 @@ class ContentDisplay(QWidget):
         
     def clear_content(self):
         """Clear all displayed content."""
-        self.code_editor.clear()
+        # clear_session_data() below resets the session, so don't report an edit
+        with QSignalBlocker(self.code_editor):
+            self.code_editor.clear()
         self.explanation_text.setMarkdown("")
         self.time_complexity.setText("N/A")
         self.space_complexity.setText("N/A")
         self._is_optimized = False
         self.clear_session_data()
         
+    def _update_session_from_values(self, code, explanation_md, time_complexity,
+                                    space_complexity, is_optimized):
+        """
+        Record the session from the values just displayed.
+        
+        Avoids toPlainText()/toMarkdown(), which would walk and re-serialise
+        the documents that were only just built from these same strings.
+        """
+        self.current_session = {
+            "code": code,
+            "explanation": explanation_md,
+            "time_complexity": time_complexity,
+            "space_complexity": space_complexity,
+            "is_optimized": is_optimized
+        }
+        logger.debug("Session data saved")
+        
     def save_session_data(self):
-        """Save current session data."""
+        """Save current session data from the (possibly user-edited) widgets."""
         self.current_session = {
             "code": self.code_editor.toPlainText(),
             "explanation": self.explanation_text.toMarkdown(),
@@ -284,7 +440,7 @@ class ContentDisplay(QWidget):
     def restore_session_data(self):
         """Restore session data to UI components."""
         if self.current_session["code"]:
-            self.code_editor.setPlainText(self.current_session["code"])
+            self._set_code(self.current_session["code"])
             self.explanation_text.setMarkdown(self.current_session["explanation"])
             self.time_complexity.setText(self.current_session["time_complexity"])
             self.space_complexity.setText(self.current_session["space_complexity"])
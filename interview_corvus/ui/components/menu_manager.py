@@ -3,17 +3,63 @@ Menu and System Tray Component.
 Handles menu bar and system tray functionality.
 """
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (
     QMenuBar, QMenu, QSystemTrayIcon, QMessageBox
 )
-from PyQt6.QtCore import pyqtSignal, QObject
+from PyQt6.QtCore import Qt, pyqtSignal, QObject
 from PyQt6.QtGui import QAction, QKeySequence, QIcon, QPixmap, QColor
 from loguru import logger
 
+from interview_corvus import __version__
 from interview_corvus.config import settings
 from interview_corvus.ui.styles import Theme
 
 
+# About dialog body; nothing in it changes while the app is running
+_ABOUT_HTML = f"""
+<h2>{settings.app_name}</h2>
+<p>An intelligent coding assistant for interview preparation.</p>
+<p>Version: {__version__}</p>
+<p>Built with PyQt6 and modern AI technologies.</p>
+"""
+
+
+# Shared fallback tray icon, built on first use
+_TRAY_ICON = None
+
+
+def _tray_icon() -> QIcon:
+    """Return the cached fallback tray icon."""
+    global _TRAY_ICON
+    if _TRAY_ICON is None:
+        pixmap = QPixmap(16, 16)
+        pixmap.fill(QColor(74, 144, 226))  # Blue color matching theme
+        _TRAY_ICON = QIcon(pixmap)
+    return _TRAY_ICON
+
+
+@lru_cache(maxsize=1)
+def _shortcuts_html(screenshot, generate, optimize, visibility, reset, up, down, left, right, panic) -> str:
+    """Render the shortcuts dialog body; re-rendered only when a hotkey changes."""
+    return f"""
+        <h2>Keyboard Shortcuts</h2>
+        <ul>
+            <li><b>{screenshot}</b>: Take Screenshot</li>
+            <li><b>{generate}</b>: Generate Solution</li>
+            <li><b>{optimize}</b>: Optimize Solution</li>
+            <li><b>{visibility}</b>: Toggle Visibility</li>
+            <li><b>{reset}</b>: Reset Chat History and Screenshots</li>
+            <li><b>{up}</b>: Move Window Up</li>
+            <li><b>{down}</b>: Move Window Down</li>
+            <li><b>{left}</b>: Move Window Left</li>
+            <li><b>{right}</b>: Move Window Right</li>
+            <li><b>{panic}</b>: Panic Mode (Instant Hide)</li>
+        </ul>
+        """
+
+
 class MenuManager(QObject):
     """Manages menu bar and system tray functionality."""
     
@@ -30,13 +76,31 @@ class MenuManager(QObject):
     toggle_always_on_top_triggered = pyqtSignal(bool)
     close_app_triggered = pyqtSignal()
     
+    # (action attribute, menu label, settings.hotkeys field)
+    _HOTKEY_ACTIONS = (
+        ("take_screenshot_action", "Take Screenshot", "screenshot_key"),
+        ("generate_solution_action", "Generate Solution", "generate_solution_key"),
+        ("optimize_solution_action", "Optimize Solution", "optimize_solution_key"),
+        ("reset_history_action", "Reset All", "reset_history_key"),
+        ("toggle_visibility_action", "Toggle Visibility", "toggle_visibility_key"),
+    )
+    
     def __init__(self, parent_window):
         super().__init__()
         self.parent_window = parent_window
         self.menu_bar = None
         self.tray_icon = None
+        self.tray_menu = None
         self.always_on_top_action = None
         self.tray_always_on_top_action = None
+        self.take_screenshot_action = None
+        self.generate_solution_action = None
+        self.optimize_solution_action = None
+        self.reset_history_action = None
+        self.toggle_visibility_action = None
+        # Help dialogs, built on first open and reused afterwards
+        self._about_box = None
+        self._shortcuts_box = None
         
     def create_menu_bar(self):
         """Create the application menu bar."""
@@ -51,19 +115,28 @@ class MenuManager(QObject):
         # Help menu
         self._create_help_menu()
         
+        self.update_action_texts()
         return self.menu_bar
         
+    def update_action_texts(self):
+        """Update menu action labels and shortcuts to the current hotkey settings."""
+        hotkeys = settings.hotkeys
+        for attr, label, key_field in self._HOTKEY_ACTIONS:
+            action = getattr(self, attr)
+            if action is None:
+                continue
+            key = getattr(hotkeys, key_field)
+            action.setText(f"{label} ({key})")
+            action.setShortcut(key)
+        
     def _create_file_menu(self):
         """Create the File menu."""
         file_menu = self.menu_bar.addMenu("&File")
         
         # Take screenshot
-        take_screenshot_action = QAction(
-            f"Take Screenshot ({settings.hotkeys.screenshot_key})", self.parent_window
-        )
-        take_screenshot_action.setShortcut(settings.hotkeys.screenshot_key)
-        take_screenshot_action.triggered.connect(self.take_screenshot_triggered.emit)
-        file_menu.addAction(take_screenshot_action)
+        self.take_screenshot_action = QAction("Take Screenshot", self.parent_window)
+        self.take_screenshot_action.triggered.connect(self.take_screenshot_triggered.emit)
+        file_menu.addAction(self.take_screenshot_action)
         
         # Settings
         settings_action = QAction("Settings", self.parent_window)
@@ -71,28 +144,19 @@ class MenuManager(QObject):
         file_menu.addAction(settings_action)
         
         # Generate solution
-        generate_solution_action = QAction(
-            f"Generate Solution ({settings.hotkeys.generate_solution_key})", self.parent_window
-        )
-        generate_solution_action.setShortcut(settings.hotkeys.generate_solution_key)
-        generate_solution_action.triggered.connect(self.generate_solution_triggered.emit)
-        file_menu.addAction(generate_solution_action)
+        self.generate_solution_action = QAction("Generate Solution", self.parent_window)
+        self.generate_solution_action.triggered.connect(self.generate_solution_triggered.emit)
+        file_menu.addAction(self.generate_solution_action)
         
         # Optimize solution
-        optimize_solution_action = QAction(
-            f"Optimize Solution ({settings.hotkeys.optimize_solution_key})", self.parent_window
-        )
-        optimize_solution_action.setShortcut(settings.hotkeys.optimize_solution_key)
-        optimize_solution_action.triggered.connect(self.optimize_solution_triggered.emit)
-        file_menu.addAction(optimize_solution_action)
+        self.optimize_solution_action = QAction("Optimize Solution", self.parent_window)
+        self.optimize_solution_action.triggered.connect(self.optimize_solution_triggered.emit)
+        file_menu.addAction(self.optimize_solution_action)
         
         # Reset history
-        reset_history_action = QAction(
-            f"Reset All ({settings.hotkeys.reset_history_key})", self.parent_window
-        )
-        reset_history_action.setShortcut(settings.hotkeys.reset_history_key)
-        reset_history_action.triggered.connect(self.reset_history_triggered.emit)
-        file_menu.addAction(reset_history_action)
+        self.reset_history_action = QAction("Reset All", self.parent_window)
+        self.reset_history_action.triggered.connect(self.reset_history_triggered.emit)
+        file_menu.addAction(self.reset_history_action)
         
         file_menu.addSeparator()
         
@@ -107,12 +171,9 @@ class MenuManager(QObject):
         view_menu = self.menu_bar.addMenu("&View")
         
         # Toggle visibility
-        toggle_visibility_action = QAction(
-            f"Toggle Visibility ({settings.hotkeys.toggle_visibility_key})", self.parent_window
-        )
-        toggle_visibility_action.setShortcut(settings.hotkeys.toggle_visibility_key)
-        toggle_visibility_action.triggered.connect(self.toggle_visibility_triggered.emit)
-        view_menu.addAction(toggle_visibility_action)
+        self.toggle_visibility_action = QAction("Toggle Visibility", self.parent_window)
+        self.toggle_visibility_action.triggered.connect(self.toggle_visibility_triggered.emit)
+        view_menu.addAction(self.toggle_visibility_action)
         
         # Always on top
         self.always_on_top_action = QAction("Always on Top", self.parent_window)
@@ -154,17 +215,24 @@ class MenuManager(QObject):
         """Create the system tray icon and menu."""
         self.tray_icon = QSystemTrayIcon(self.parent_window)
         
-        # Create a simple colored icon as fallback
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(QColor(74, 144, 226))  # Blue color matching theme
-        icon = QIcon(pixmap)
-        
-        self.tray_icon.setIcon(icon)
+        # Simple colored icon as fallback
+        self.tray_icon.setIcon(_tray_icon())
         self.tray_icon.setToolTip(settings.app_name)
         self.tray_icon.activated.connect(self._on_tray_activated)
         
-        # Create context menu
-        tray_menu = QMenu()
+        # Context menu actions are built the first time the menu opens
+        self.tray_menu = QMenu()
+        self.tray_menu.aboutToShow.connect(self._populate_tray_menu)
+        
+        self.tray_icon.setContextMenu(self.tray_menu)
+        self.tray_icon.show()
+        
+        return self.tray_icon
+        
+    def _populate_tray_menu(self):
+        """Build the tray context menu on first use."""
+        self.tray_menu.aboutToShow.disconnect(self._populate_tray_menu)
+        tray_menu = self.tray_menu
         
         # Show/Hide
         show_action = tray_menu.addAction("Show/Hide")
@@ -193,11 +261,6 @@ class MenuManager(QObject):
         quit_action = tray_menu.addAction("Quit")
         quit_action.triggered.connect(self.close_app_triggered.emit)
         
-        self.tray_icon.setContextMenu(tray_menu)
-        self.tray_icon.show()
-        
-        return self.tray_icon
-        
     def _on_tray_activated(self, reason):
         """Handle tray icon activation."""
         if reason == QSystemTrayIcon.ActivationReason.Trigger:
@@ -206,36 +269,47 @@ class MenuManager(QObject):
             
     def update_always_on_top_state(self, enabled: bool):
         """Update the always on top menu state."""
-        if self.always_on_top_action:
-            self.always_on_top_action.setChecked(enabled)
-        if self.tray_always_on_top_action:
-            self.tray_always_on_top_action.setChecked(enabled)
+        # The action that triggered the change is usually already in sync
+        for action in (self.always_on_top_action, self.tray_always_on_top_action):
+            if action and action.isChecked() != enabled:
+                action.setChecked(enabled)
             
     def show_about_dialog(self):
         """Show the about dialog."""
-        about_text = f"""
-        <h2>{settings.app_name}</h2>
-        <p>An intelligent coding assistant for interview preparation.</p>
-        <p>Version: 1.0.0</p>
-        <p>Built with PyQt6 and modern AI technologies.</p>
-        """
-        QMessageBox.about(self.parent_window, "About", about_text)
+        if self._about_box is None:
+            self._about_box = QMessageBox(
+                QMessageBox.Icon.NoIcon, "About", _ABOUT_HTML,
+                QMessageBox.StandardButton.Ok, self.parent_window
+            )
+            self._about_box.setTextFormat(Qt.TextFormat.RichText)
+            # Same icon QMessageBox.about() would pick
+            icon = self.parent_window.windowIcon()
+            if not icon.isNull():
+                self._about_box.setIconPixmap(icon.pixmap(64))
+        self._about_box.exec()
         
     def show_shortcuts_dialog(self):
         """Show the keyboard shortcuts dialog."""
-        shortcuts = f"""
-        <h2>Keyboard Shortcuts</h2>
-        <ul>
-            <li><b>{settings.hotkeys.screenshot_key}</b>: Take Screenshot</li>
-            <li><b>{settings.hotkeys.generate_solution_key}</b>: Generate Solution</li>
-            <li><b>{settings.hotkeys.optimize_solution_key}</b>: Optimize Solution</li>
-            <li><b>{settings.hotkeys.toggle_visibility_key}</b>: Toggle Visibility</li>
-            <li><b>{settings.hotkeys.reset_history_key}</b>: Reset Chat History and Screenshots</li>
-            <li><b>{settings.hotkeys.move_window_keys["up"]}</b>: Move Window Up</li>
-            <li><b>{settings.hotkeys.move_window_keys["down"]}</b>: Move Window Down</li>
-            <li><b>{settings.hotkeys.move_window_keys["left"]}</b>: Move Window Left</li>
-            <li><b>{settings.hotkeys.move_window_keys["right"]}</b>: Move Window Right</li>
-            <li><b>{settings.hotkeys.panic_key}</b>: Panic Mode (Instant Hide)</li>
-        </ul>
-        """
-        QMessageBox.information(self.parent_window, "Keyboard Shortcuts", shortcuts)
+        hotkeys = settings.hotkeys
+        move_keys = hotkeys.move_window_keys
+        shortcuts = _shortcuts_html(
+            hotkeys.screenshot_key,
+            hotkeys.generate_solution_key,
+            hotkeys.optimize_solution_key,
+            hotkeys.toggle_visibility_key,
+            hotkeys.reset_history_key,
+            move_keys["up"],
+            move_keys["down"],
+            move_keys["left"],
+            move_keys["right"],
+            hotkeys.panic_key,
+        )
+        if self._shortcuts_box is None:
+            self._shortcuts_box = QMessageBox(
+                QMessageBox.Icon.Information, "Keyboard Shortcuts", "",
+                QMessageBox.StandardButton.Ok, self.parent_window
+            )
+            self._shortcuts_box.setTextFormat(Qt.TextFormat.RichText)
+        if self._shortcuts_box.text() != shortcuts:
+            self._shortcuts_box.setText(shortcuts)
+        self._shortcuts_box.exec()
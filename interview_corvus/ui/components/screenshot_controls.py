@@ -7,13 +7,71 @@ from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel, QScrollArea, 
     QComboBox, QApplication, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QPixmap, QColor
 from loguru import logger
 
 from interview_corvus.config import settings
 
 
+# Thumbnail strip stylesheets, shared by every tile
+_SELECTED_STYLE = """
+    border: 2px solid #4A90E2; 
+    border-radius: 4px;
+    background-color: #f0f7ff;
+    padding: 2px;
+"""
+
+_UNSELECTED_STYLE = """
+    border: 1px solid #ddd; 
+    border-radius: 4px;
+    background-color: white;
+    padding: 2px;
+"""
+
+_INDEX_LABEL_STYLE = """
+    font-size: 7px; 
+    color: #888; 
+    font-weight: normal;
+    background-color: rgba(74, 144, 226, 0.08);
+    border-radius: 1px;
+    padding: 0px 2px;
+    max-height: 12px;
+"""
+
+_PLACEHOLDER_STYLE = """
+    color: #999; 
+    font-style: italic; 
+    padding: 12px;
+    font-size: 11px;
+    background-color: #f5f5f5;
+    border: 1px dashed #ddd;
+    border-radius: 4px;
+"""
+
+_HOVER_STYLE = """
+    QWidget:hover {
+        background-color: #f8f9fa;
+        border-radius: 8px;
+    }
+"""
+
+
+class _ThumbTile(QWidget):
+    """Clickable thumbnail tile that reports its position in the strip."""
+    
+    clicked = pyqtSignal(int)
+    
+    def __init__(self, idx, parent=None):
+        super().__init__(parent)
+        self.idx = idx
+        
+    def mouseReleaseEvent(self, event):
+        """Emit the tile index when clicked."""
+        self.clicked.emit(self.idx)
+        super().mouseReleaseEvent(event)
+
+
 class ScreenshotControls(QWidget):
     """Widget for screenshot management and monitor selection."""
     
@@ -25,6 +83,13 @@ class ScreenshotControls(QWidget):
         super().__init__(parent)
         self.screenshot_manager = screenshot_manager
         self.selected_screenshot_index = -1
+        # Screenshot at the selected index when it was selected; eviction at
+        # the cap can put a new screenshot at the same index
+        self._selected_screenshot = None
+        # Thumbnail tiles kept parallel to the screenshot list
+        self._thumb_widgets = []
+        self._thumb_labels = []
+        self._thumb_sources = []
         self.setup_ui()
         self.connect_signals()
         
@@ -85,6 +150,12 @@ class ScreenshotControls(QWidget):
         self.thumbnails_layout.setContentsMargins(2, 2, 2, 2)
         self.thumbnails_layout.setSpacing(6)
         
+        # Placeholder shown while there are no screenshots
+        self.thumbnails_placeholder = QLabel("No screenshots")
+        self.thumbnails_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.thumbnails_placeholder.setStyleSheet(_PLACEHOLDER_STYLE)
+        self.thumbnails_layout.addWidget(self.thumbnails_placeholder)
+        
         thumbnails_scroll = QScrollArea()
         thumbnails_scroll.setWidgetResizable(True)
         thumbnails_scroll.setWidget(self.thumbnails_container)
@@ -160,9 +231,11 @@ class ScreenshotControls(QWidget):
         self.screen_combo.setEnabled(True)
         
         # Connect screen events
-        QApplication.instance().screenAdded.connect(self.update_screen_list)
-        QApplication.instance().screenRemoved.connect(self.update_screen_list)
+        app = QApplication.instance()
+        app.screenAdded.connect(self.update_screen_list)
+        app.screenRemoved.connect(self.update_screen_list)
         
+    @pyqtSlot()
     def update_screen_list(self):
         """Update the list of available monitors in the dropdown."""
         self.screen_combo.clear()
@@ -178,110 +251,91 @@ class ScreenshotControls(QWidget):
         return self.screen_combo.currentData()
         
     def update_thumbnails(self):
-        """Update screenshot thumbnails display."""
-        # Clear existing thumbnails
-        while self.thumbnails_layout.count():
-            item = self.thumbnails_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-                
-        # Get all screenshots
+        """Sync the thumbnail strip with the current screenshots."""
         screenshots = self.screenshot_manager.get_all_screenshots()
         
-        if not screenshots:
-            # Add placeholder
-            placeholder = QLabel("No screenshots")
-            placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            placeholder.setStyleSheet("""
-                color: #999; 
-                font-style: italic; 
-                padding: 12px;
-                font-size: 11px;
-                background-color: #f5f5f5;
-                border: 1px dashed #ddd;
-                border-radius: 4px;
-            """)
-            self.thumbnails_layout.addWidget(placeholder)
-            self.selected_screenshot_index = -1
-            return
+        # Drop tiles past the end of the list
+        while len(self._thumb_widgets) > len(screenshots):
+            widget = self._thumb_widgets.pop()
+            self._thumb_labels.pop()
+            self._thumb_sources.pop()
+            self.thumbnails_layout.removeWidget(widget)
+            widget.deleteLater()
             
-        # Add thumbnails for each screenshot
-        for i, screenshot in enumerate(screenshots):
-            thumbnail_widget = QWidget()
-            thumbnail_layout = QVBoxLayout(thumbnail_widget)
-            thumbnail_layout.setContentsMargins(2, 2, 2, 2)
-            thumbnail_layout.setSpacing(2)
-            
-            # Create thumbnail
-            thumbnail = QLabel()
-            pixmap = screenshot["pixmap"].scaled(
-                QSize(150, 120),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            thumbnail.setPixmap(pixmap)
-            thumbnail.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Add tiles for new screenshots
+        while len(self._thumb_widgets) < len(screenshots):
+            self._add_thumbnail_tile(len(self._thumb_widgets))
             
-            # Style based on selection
-            if i == self.selected_screenshot_index:
-                thumbnail.setStyleSheet("""
-                    border: 2px solid #4A90E2; 
-                    border-radius: 4px;
-                    background-color: #f0f7ff;
-                    padding: 2px;
-                """)
-            else:
-                thumbnail.setStyleSheet("""
-                    border: 1px solid #ddd; 
-                    border-radius: 4px;
-                    background-color: white;
-                    padding: 2px;
-                """)
+        # Refresh only tiles whose screenshot changed (e.g. the oldest was evicted)
+        for i, screenshot in enumerate(screenshots):
+            if self._thumb_sources[i] is not screenshot:
+                self._thumb_sources[i] = screenshot
+                self._thumb_labels[i].setPixmap(screenshot["thumb_pixmap"])
                 
-            thumbnail_layout.addWidget(thumbnail)
-            
-            # Index number
-            index_label = QLabel(f"#{i + 1}")
-            index_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            index_label.setStyleSheet("""
-                font-size: 7px; 
-                color: #888; 
-                font-weight: normal;
-                background-color: rgba(74, 144, 226, 0.08);
-                border-radius: 1px;
-                padding: 0px 2px;
-                max-height: 12px;
-            """)
-            thumbnail_layout.addWidget(index_label)
-            
-            # Make widget clickable
-            thumbnail_widget.mouseReleaseEvent = (
-                lambda event, idx=i: self.select_screenshot(idx)
-            )
-            thumbnail_widget.setCursor(Qt.CursorShape.PointingHandCursor)
-            
-            # Hover effect
-            thumbnail_widget.setStyleSheet("""
-                QWidget:hover {
-                    background-color: #f8f9fa;
-                    border-radius: 8px;
-                }
-            """)
-            
-            self.thumbnails_layout.addWidget(thumbnail_widget)
+        self.thumbnails_placeholder.setVisible(not screenshots)
+        if not screenshots:
+            self.selected_screenshot_index = -1
+            self._selected_screenshot = None
+            return
             
         # Auto-select most recent if none selected
-        if self.selected_screenshot_index == -1 and screenshots:
+        if self.selected_screenshot_index == -1:
             self.select_screenshot(len(screenshots) - 1)
             
+    def _add_thumbnail_tile(self, i):
+        """Create the thumbnail tile for position i and append it to the strip."""
+        thumbnail_widget = _ThumbTile(i)
+        thumbnail_layout = QVBoxLayout(thumbnail_widget)
+        thumbnail_layout.setContentsMargins(2, 2, 2, 2)
+        thumbnail_layout.setSpacing(2)
+        
+        # Thumbnail image, filled in by update_thumbnails
+        thumbnail = QLabel()
+        thumbnail.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        thumbnail_layout.addWidget(thumbnail)
+        
+        # Index number
+        index_label = QLabel(f"#{i + 1}")
+        index_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        index_label.setStyleSheet(_INDEX_LABEL_STYLE)
+        thumbnail_layout.addWidget(index_label)
+        
+        # Make widget clickable
+        thumbnail_widget.clicked.connect(self.select_screenshot)
+        thumbnail_widget.setCursor(Qt.CursorShape.PointingHandCursor)
+        
+        # Hover effect
+        thumbnail_widget.setStyleSheet(_HOVER_STYLE)
+        
+        self._thumb_widgets.append(thumbnail_widget)
+        self._thumb_labels.append(thumbnail)
+        self._thumb_sources.append(None)
+        self._apply_selection_style(i, i == self.selected_screenshot_index)
+        self.thumbnails_layout.addWidget(thumbnail_widget)
+        
+    def _apply_selection_style(self, index, selected):
+        """Restyle a single thumbnail to reflect its selection state."""
+        if not 0 <= index < len(self._thumb_labels):
+            return
+        self._thumb_labels[index].setStyleSheet(
+            _SELECTED_STYLE if selected else _UNSELECTED_STYLE
+        )
+            
+    @pyqtSlot(int)
     def select_screenshot(self, index):
         """Select a screenshot by index."""
-        screenshots = self.screenshot_manager.get_all_screenshots()
-        if 0 <= index < len(screenshots):
-            self.selected_screenshot_index = index
-            logger.info(f"Selected screenshot {index}")
-            self.screenshot_selected.emit(index)
-            self.update_thumbnails()
+        screenshot = self.screenshot_manager.get_screenshot(index) if index >= 0 else None
+        if screenshot is None:
+            return
+        # Nothing to do if this exact screenshot is already selected
+        if index == self.selected_screenshot_index and screenshot is self._selected_screenshot:
+            return
+        self._apply_selection_style(self.selected_screenshot_index, False)
+        self.selected_screenshot_index = index
+        self._selected_screenshot = screenshot
+        self._apply_selection_style(index, True)
+        logger.info(f"Selected screenshot {index}")
+        self.screenshot_selected.emit(index)
             
     def get_selected_screenshot_index(self):
         """Get the currently selected screenshot index."""
@@ -291,4 +345,5 @@ class ScreenshotControls(QWidget):
         """Clear all screenshots and update display."""
         self.screenshot_manager.clear_screenshots()
         self.selected_screenshot_index = -1
+        self._selected_screenshot = None
         self.update_thumbnails()
@@ -9,6 +9,7 @@ from PyQt6.QtGui import QCursor
 from loguru import logger
 
 from interview_corvus.config import settings
+from interview_corvus.ui.components import web_server_available
 
 
 class StatusBarManager(QObject):
@@ -48,7 +49,7 @@ class StatusBarManager(QObject):
             return None
             
         # Get the current web server port
-        server_port = getattr(self.parent_window, 'web_server_port', 26262)
+        server_port = self.parent_window.web_server_port
             
         container = QWidget()
         layout = QHBoxLayout(container)
@@ -124,12 +125,11 @@ class StatusBarManager(QObject):
         
         
         # Web server status (if available)
-        try:
-            from interview_corvus.api.web_server import create_integrated_web_server
+        if web_server_available():
             self.web_server_status = QLabel("🌐 API: Off")
             self.web_server_status.setStyleSheet("color: #ff6b6b; font-weight: bold; font-size: 12px;")
             self.status_bar.addPermanentWidget(self.web_server_status)
-        except ImportError:
+        else:
             logger.debug("Web server not available, skipping status widget")
 
         # App title in the middle
@@ -152,10 +152,10 @@ class StatusBarManager(QObject):
     def update_web_server_status(self, is_running: bool, port: int = None):
         """Update the web server status display."""
         # Check if we need to refresh network IPs due to port change
-        old_port = getattr(self.parent_window, 'web_server_port', None)
+        old_port = self.parent_window.web_server_port
         needs_refresh = (port != old_port and port is not None)
         
-        if self.web_server_status:
+        if self.web_server_status is not None:
             if is_running:
                 port_text = f":{port}" if port else ""
                 self.web_server_status.setText(f"🌐 API: On")
@@ -165,7 +165,7 @@ class StatusBarManager(QObject):
                 self.web_server_status.setStyleSheet("color: #ff6b6b; font-weight: bold; font-size: 12px;")
         
         # Refresh network IPs if port changed and status bar is ready
-        if needs_refresh and self.status_bar and hasattr(self.status_bar, 'parent') and self.status_bar.parent():
+        if needs_refresh and self.status_bar is not None and self.status_bar.parent():
             self.refresh_network_ips()
     
     def refresh_network_ips(self):
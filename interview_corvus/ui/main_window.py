@@ -4,6 +4,7 @@ This version breaks down the original large MainWindow class into manageable com
 """
 
 import platform
+from functools import lru_cache
 from loguru import logger
 from PyQt6.QtCore import QEvent, Qt, QThread, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import (
@@ -16,7 +17,7 @@ from interview_corvus.core.llm_service import LLMService
 from interview_corvus.invisibility.invisibility_manager import InvisibilityManager
 from interview_corvus.screenshot.screenshot_manager import ScreenshotManager
 from interview_corvus.ui.settings_dialog import SettingsDialog
-from interview_corvus.ui.styles import Styles, Theme
+from interview_corvus.ui.styles import Styles
 
 # Import our new components
 from interview_corvus.ui.components.action_bar import ActionBar
@@ -24,15 +25,208 @@ from interview_corvus.ui.components.screenshot_controls import ScreenshotControl
 from interview_corvus.ui.components.content_display import ContentDisplay
 from interview_corvus.ui.components.menu_manager import MenuManager
 from interview_corvus.ui.components.status_bar import StatusBarManager
+from interview_corvus.ui.components import web_server_available
 
-# Try to import web server (optional dependency)
-try:
+# Web server is an optional dependency; the components use the same check
+WEB_SERVER_AVAILABLE = web_server_available()
+if WEB_SERVER_AVAILABLE:
     from interview_corvus.api.web_server import create_integrated_web_server
-    WEB_SERVER_AVAILABLE = True
-except ImportError:
-    WEB_SERVER_AVAILABLE = False
+else:
     logger.warning("Web server dependencies not available. Web API will be disabled.")
 
+_PLATFORM = platform.system()
+
+
+@lru_cache(maxsize=1)
+def _is_windows_admin() -> bool:
+    """Whether the process runs elevated; fixed for the lifetime of the process."""
+    import ctypes
+
+    return bool(ctypes.windll.shell32.IsUserAnAdmin())
+
+
+# Minimal modern stylesheet, built once at import
+_MINIMAL_QSS = """
+    QMainWindow {
+        background-color: #ffffff;
+        color: #333333;
+    }
+    
+    QWidget {
+        background-color: #ffffff;
+        color: #333333;
+    }
+    
+    QPushButton {
+        background-color: #4A90E2;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 6px 8px;
+        font-weight: 600;
+        font-size: 11px;
+        min-height: 18px;
+    }
+    
+    QPushButton:hover {
+        background-color: #357ABD;
+        transform: translateY(-1px);
+    }
+    
+    QPushButton:pressed {
+        background-color: #2868A0;
+        transform: translateY(0px);
+    }
+    
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+    
+    QComboBox {
+        background-color: #f8f9fa;
+        border: 1px solid #e1e4e8;
+        border-radius: 4px;
+        padding: 6px 10px;
+        font-size: 12px;
+        min-height: 16px;
+    }
+    
+    QComboBox:hover {
+        border-color: #4A90E2;
+    }
+    
+    QComboBox:focus {
+        border-color: #4A90E2;
+        outline: none;
+    }
+    
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    
+    QComboBox::down-arrow {
+        width: 12px;
+        height: 12px;
+    }
+    
+    QSplitter::handle {
+        background-color: #e1e4e8;
+        width: 2px;
+    }
+    
+    QSplitter::handle:hover {
+        background-color: #4A90E2;
+    }
+    
+    QScrollArea {
+        background-color: #f8f9fa;
+        border: 1px solid #e1e4e8;
+        border-radius: 4px;
+    }
+    
+    QScrollBar:horizontal {
+        background-color: #f8f9fa;
+        height: 10px;
+        border-radius: 5px;
+    }
+    
+    QScrollBar::handle:horizontal {
+        background-color: #ced4da;
+        border-radius: 5px;
+        min-width: 20px;
+    }
+    
+    QScrollBar::handle:horizontal:hover {
+        background-color: #adb5bd;
+    }
+    
+    QScrollBar:vertical {
+        background-color: #f8f9fa;
+        width: 10px;
+        border-radius: 5px;
+    }
+    
+    QScrollBar::handle:vertical {
+        background-color: #ced4da;
+        border-radius: 5px;
+        min-height: 20px;
+    }
+    
+    QScrollBar::handle:vertical:hover {
+        background-color: #adb5bd;
+    }
+    
+    QLabel {
+        color: #333333;
+    }
+    
+    QPlainTextEdit {
+        background-color: #ffffff;
+        color: #333333;
+        border: 1px solid #e1e4e8;
+        border-radius: 6px;
+        padding: 12px;
+        font-family: "Fira Code", "Consolas", "Monaco", monospace;
+        font-size: 12px;
+        line-height: 1.5;
+        selection-background-color: #b3d7ff;
+    }
+    
+    QTextEdit {
+        background-color: #f8f9fa;
+        border: 1px solid #e1e4e8;
+        border-radius: 6px;
+        padding: 12px;
+        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
+        font-size: 13px;
+        line-height: 1.5;
+    }
+    
+    QStatusBar {
+        background-color: #f8f9fa;
+        border-top: 1px solid #e1e4e8;
+        font-size: 11px;
+        color: #666;
+        padding: 3px 6px;
+    }
+    """
+
+
+# Window offset per move hotkey, keyed by direction
+_MOVE_DISTANCE = 50
+_MOVE_DELTAS = {
+    "up": (0, -_MOVE_DISTANCE),
+    "down": (0, _MOVE_DISTANCE),
+    "left": (-_MOVE_DISTANCE, 0),
+    "right": (_MOVE_DISTANCE, 0),
+}
+
+
+class LLMRequestThread(QThread):
+    """Thread that runs a single LLM service request off the GUI thread."""
+
+    solution_ready = pyqtSignal(object)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, request, *args):
+        """
+        Args:
+            request: Bound LLM service method to call
+            *args: Positional arguments passed to the request
+        """
+        super().__init__()
+        self.request = request
+        self.args = args
+
+    def run(self):
+        try:
+            self.solution_ready.emit(self.request(*self.args))
+        except Exception as e:
+            logger.error(f"Error in LLM request thread: {e}")
+            self.error_occurred.emit(str(e))
+
 
 class MainWindow(QMainWindow):
     """
@@ -47,6 +241,7 @@ class MainWindow(QMainWindow):
         # Core managers
         self.invisibility_manager = invisibility_manager
         self.hotkey_manager = hotkey_manager
+        self._clipboard = QApplication.clipboard()
         # hotkey disabled, so no permissions for now
         # self.check_and_request_permissions()
 
@@ -70,10 +265,19 @@ class MainWindow(QMainWindow):
         self.processing_screenshot = False
         self.solution_text = ""
 
-        # Auto-save timer for session persistence
-        self.session_save_timer = QTimer()
-        self.session_save_timer.setSingleShot(True)
-        self.session_save_timer.timeout.connect(self._save_session_data)
+        # Set when the code editor changed since the last session snapshot;
+        # the snapshot itself is deferred until the window hides or closes
+        self._session_dirty = False
+        self._resize_save_timer = QTimer(self)
+        self._resize_save_timer.setSingleShot(True)
+        self._resize_save_timer.setInterval(200)
+        self._resize_save_timer.timeout.connect(self._save_session_data)
+
+        # Coalesces rapid settings toggles into a single user_settings.json write
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(1000)
+        self._settings_save_timer.timeout.connect(settings.save_user_settings)
 
         # Set up UI with components
         self.init_ui()
@@ -180,7 +384,6 @@ class MainWindow(QMainWindow):
 
         # Update initial state
         self.screenshot_controls.update_thumbnails()
-        self.action_bar.update_button_texts()
         logger.info("Initial state updated")
 
         # Update web server status if auto-started
@@ -234,160 +437,13 @@ class MainWindow(QMainWindow):
         self.invisibility_manager.visibility_changed.connect(self.on_visibility_changed)
         self.invisibility_manager.screen_sharing_detected.connect(self.on_screen_sharing_detected)
 
-        # Screen change signals
-        QApplication.instance().screenAdded.connect(self.screenshot_controls.update_screen_list)
-        QApplication.instance().screenRemoved.connect(self.screenshot_controls.update_screen_list)
+        # Screen add/remove is wired up by ScreenshotControls itself
 
         logger.info("Connected all component signals")
 
     def _get_minimal_stylesheet(self):
         """Get the minimal modern stylesheet."""
-        return """
-        QMainWindow {
-            background-color: #ffffff;
-            color: #333333;
-        }
-        
-        QWidget {
-            background-color: #ffffff;
-            color: #333333;
-        }
-        
-        QPushButton {
-            background-color: #4A90E2;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            padding: 6px 8px;
-            font-weight: 600;
-            font-size: 11px;
-            min-height: 18px;
-        }
-        
-        QPushButton:hover {
-            background-color: #357ABD;
-            transform: translateY(-1px);
-        }
-        
-        QPushButton:pressed {
-            background-color: #2868A0;
-            transform: translateY(0px);
-        }
-        
-        QPushButton:disabled {
-            background-color: #cccccc;
-            color: #666666;
-        }
-        
-        QComboBox {
-            background-color: #f8f9fa;
-            border: 1px solid #e1e4e8;
-            border-radius: 4px;
-            padding: 6px 10px;
-            font-size: 12px;
-            min-height: 16px;
-        }
-        
-        QComboBox:hover {
-            border-color: #4A90E2;
-        }
-        
-        QComboBox:focus {
-            border-color: #4A90E2;
-            outline: none;
-        }
-        
-        QComboBox::drop-down {
-            border: none;
-            width: 20px;
-        }
-        
-        QComboBox::down-arrow {
-            width: 12px;
-            height: 12px;
-        }
-        
-        QSplitter::handle {
-            background-color: #e1e4e8;
-            width: 2px;
-        }
-        
-        QSplitter::handle:hover {
-            background-color: #4A90E2;
-        }
-        
-        QScrollArea {
-            background-color: #f8f9fa;
-            border: 1px solid #e1e4e8;
-            border-radius: 4px;
-        }
-        
-        QScrollBar:horizontal {
-            background-color: #f8f9fa;
-            height: 10px;
-            border-radius: 5px;
-        }
-        
-        QScrollBar::handle:horizontal {
-            background-color: #ced4da;
-            border-radius: 5px;
-            min-width: 20px;
-        }
-        
-        QScrollBar::handle:horizontal:hover {
-            background-color: #adb5bd;
-        }
-        
-        QScrollBar:vertical {
-            background-color: #f8f9fa;
-            width: 10px;
-            border-radius: 5px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #ced4da;
-            border-radius: 5px;
-            min-height: 20px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #adb5bd;
-        }
-        
-        QLabel {
-            color: #333333;
-        }
-        
-        QPlainTextEdit {
-            background-color: #ffffff;
-            color: #333333;
-            border: 1px solid #e1e4e8;
-            border-radius: 6px;
-            padding: 12px;
-            font-family: "Fira Code", "Consolas", "Monaco", monospace;
-            font-size: 12px;
-            line-height: 1.5;
-            selection-background-color: #b3d7ff;
-        }
-        
-        QTextEdit {
-            background-color: #f8f9fa;
-            border: 1px solid #e1e4e8;
-            border-radius: 6px;
-            padding: 12px;
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
-            font-size: 13px;
-            line-height: 1.5;
-        }
-        
-        QStatusBar {
-            background-color: #f8f9fa;
-            border-top: 1px solid #e1e4e8;
-            font-size: 11px;
-            color: #666;
-            padding: 3px 6px;
-        }
-        """
+        return _MINIMAL_QSS
 
     # Core action methods
     @pyqtSlot()
@@ -420,12 +476,12 @@ class MainWindow(QMainWindow):
         )
         self.screenshot_controls.update_thumbnails()
         # Select the newly captured screenshot (last one in the list)
-        screenshot_count = len(self.screenshot_manager.get_all_screenshots())
+        screenshot_count = self.screenshot_manager.screenshot_count()
         if screenshot_count > 0:
             self.screenshot_controls.select_screenshot(screenshot_count - 1)
             
         # Update action bar button states - enable generate button when screenshots are available
-        has_screenshots = len(self.screenshot_manager.get_all_screenshots()) > 0
+        has_screenshots = screenshot_count > 0
         has_solution = bool(self.solution_text.strip())
         self.action_bar.update_button_states(has_screenshots=has_screenshots, has_solution=has_solution)
 
@@ -454,6 +510,7 @@ class MainWindow(QMainWindow):
 
         # Get selected language and screenshot paths
         selected_language = self.screenshot_controls.language_combo.currentText()
+        self.screenshot_manager.wait_for_pending_saves()
         screenshot_paths = [screenshot["file_path"] for screenshot in screenshots]
 
         # Create and start processing thread
@@ -493,72 +550,31 @@ class MainWindow(QMainWindow):
 
     def _create_solution_thread(self, screenshot_paths, language):
         """Create a thread for solution generation."""
-        class ScreenshotProcessingThread(QThread):
-            solution_ready = pyqtSignal(object)
-            error_occurred = pyqtSignal(str)
-
-            llm_service: LLMService = None
-
-            def __init__(self, llm_service, screenshot_paths, language):
-                super().__init__()
-                self.llm_service = llm_service
-                self.screenshot_paths = screenshot_paths
-                self.language = language
-
-            def run(self):
-                try:
-                    logger.info(f"Processing {len(self.screenshot_paths)} screenshots in thread")
-                    solution = self.llm_service.get_solution_from_screenshots(
-                        self.screenshot_paths, self.language
-                    )
-                    self.solution_ready.emit(solution)
-                except Exception as e:
-                    logger.error(f"Error in processing thread: {e}")
-                    self.error_occurred.emit(str(e))
-
-        return ScreenshotProcessingThread(self.llm_service, screenshot_paths, language)
+        return LLMRequestThread(
+            self.llm_service.get_solution_from_screenshots, screenshot_paths, language
+        )
 
     def _create_optimization_thread(self, code, language):
         """Create a thread for optimization."""
-        class OptimizationThread(QThread):
-            solution_ready = pyqtSignal(object)
-            error_occurred = pyqtSignal(str)
-
-            def __init__(self, llm_service, code, language):
-                super().__init__()
-                self.llm_service = llm_service
-                self.code = code
-                self.language = language
-
-            def run(self):
-                try:
-                    optimization = self.llm_service.get_code_optimization(self.code, self.language)
-                    self.solution_ready.emit(optimization)
-                except Exception as e:
-                    logger.error(f"Error in optimization thread: {e}")
-                    self.error_occurred.emit(str(e))
-
-        return OptimizationThread(self.llm_service, code, language)
+        return LLMRequestThread(self.llm_service.get_code_optimization, code, language)
 
     @pyqtSlot()
     def reset_chat_history(self):
         """Reset the chat history and clear screenshots."""
-        if hasattr(self.llm_service, "reset_chat_history"):
-            self.llm_service.reset_chat_history()
-            self.screenshot_controls.clear_screenshots()
-            self.content_display.clear_content()
-            self.status_bar_manager.show_message("Chat history and screenshots reset.")
-            logger.info("Chat history and screenshots have been reset")
-        else:
-            self.status_bar_manager.show_message("Chat history reset not implemented.")
+        self.llm_service.reset_chat_history()
+        self.screenshot_controls.clear_screenshots()
+        self.content_display.clear_content()
+        self.status_bar_manager.show_message("Chat history and screenshots reset.")
+        logger.info("Chat history and screenshots have been reset")
 
+    @pyqtSlot()
     def copy_solution(self):
         """Copy the solution code to clipboard."""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.content_display.get_current_code())
+        self._clipboard.setText(self.content_display.get_current_code())
         self.status_bar_manager.show_message("Solution copied to clipboard")
         logger.info("Solution copied to clipboard")
 
+    @pyqtSlot()
     def clear_screenshots(self):
         """Clear all screenshots."""
         self.screenshot_controls.clear_screenshots()
@@ -584,7 +600,7 @@ class MainWindow(QMainWindow):
             self.solution_text = str(solution)
         
         # Update button states to enable optimize and copy buttons
-        has_screenshots = len(self.screenshot_manager.get_all_screenshots()) > 0
+        has_screenshots = self.screenshot_manager.screenshot_count() > 0
         has_solution = bool(self.solution_text.strip())
         self.action_bar.update_button_states(has_screenshots=has_screenshots, has_solution=has_solution)
         
@@ -606,7 +622,7 @@ class MainWindow(QMainWindow):
         self.solution_text = optimization.optimized_code if hasattr(optimization, 'optimized_code') else str(optimization)
         
         # Update button states
-        has_screenshots = len(self.screenshot_manager.get_all_screenshots()) > 0
+        has_screenshots = self.screenshot_manager.screenshot_count() > 0
         has_solution = bool(self.solution_text.strip())
         self.action_bar.update_button_states(has_screenshots=has_screenshots, has_solution=has_solution)
         
@@ -650,45 +666,45 @@ class MainWindow(QMainWindow):
         # Update settings and show message
         settings.default_language = language
         self.status_bar_manager.show_message(f"Language updated from web to {language}")
-        settings.save_user_settings()
+        self._settings_save_timer.start()
 
+    @pyqtSlot()
     def on_code_changed(self):
         """Handle code editor changes."""
-        self.session_save_timer.start(500)
+        self._session_dirty = True
 
+    @pyqtSlot(int)
     def _on_screenshot_selected(self, index):
         """Handle screenshot selection."""
         self.status_bar_manager.show_message(f"Selected screenshot {index + 1}")
 
     def _save_session_data(self):
-        """Save session data."""
-        self.content_display.save_session_data()
+        """Save session data if the code changed since the last snapshot."""
+        if self._session_dirty:
+            self.content_display.save_session_data()
+            self._session_dirty = False
 
     # Window management methods
+    @pyqtSlot(bool)
     def set_always_on_top(self, enabled: bool):
         """Set whether the window should always be on top."""
-        flags = self.windowFlags()
-        has_flag = bool(flags & Qt.WindowType.WindowStaysOnTopHint)
-        
-        if has_flag == enabled:
+        if bool(self.windowFlags() & Qt.WindowType.WindowStaysOnTopHint) == enabled:
             return
 
-        if enabled:
-            flags |= Qt.WindowType.WindowStaysOnTopHint
-        else:
-            flags &= ~Qt.WindowType.WindowStaysOnTopHint
-
         pos = self.pos()
         visible = self.isVisible()
 
-        self.setWindowFlags(flags)
+        # Changing a window flag recreates the native window; keep it from
+        # painting until it is back in place
+        self.setUpdatesEnabled(False)
+        self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, enabled)
         self.move(pos)
-
         if visible:
             self.show()
+        self.setUpdatesEnabled(True)
 
         settings.ui.always_on_top = enabled
-        settings.save_user_settings()
+        self._settings_save_timer.start()
 
         self.menu_manager.update_always_on_top_state(enabled)
         logger.info(f"Always on top set to: {enabled}")
@@ -698,9 +714,12 @@ class MainWindow(QMainWindow):
         """Set window opacity."""
         self.setWindowOpacity(opacity)
 
+    @pyqtSlot(str)
     def set_theme(self, theme_name: str):
         """Set the application theme."""
-        self.styles.set_theme(Theme(theme_name))
+        if self.styles.theme == theme_name:
+            return
+        self.styles.set_theme(theme_name)
         self.status_bar_manager.show_message(f"Theme set to {theme_name}")
 
     @pyqtSlot()
@@ -714,10 +733,11 @@ class MainWindow(QMainWindow):
     @pyqtSlot(bool)
     def on_visibility_changed(self, is_visible: bool):
         """Handle visibility state changes."""
-        if is_visible:
-            self.action_bar.visibility_button.setText("👁️ Hide")
-        else:
-            self.action_bar.visibility_button.setText("👁️ Show")
+        label = "👁️ Hide" if is_visible else "👁️ Show"
+        if self.action_bar.visibility_button.text() != label:
+            self.action_bar.visibility_button.setText(label)
+        if not is_visible:
+            self._save_session_data()
         logger.info(f"Visibility changed to: {is_visible}")
 
     @pyqtSlot(bool)
@@ -730,20 +750,12 @@ class MainWindow(QMainWindow):
     @pyqtSlot(str)
     def move_window(self, direction: str):
         """Move window in the specified direction."""
+        dx, dy = _MOVE_DELTAS.get(direction, (0, 0))
         geometry = self.geometry()
-        x, y = geometry.x(), geometry.y()
+        # Never push the window past the top/left screen edge
+        x = max(0, geometry.x() + dx) if dx < 0 else geometry.x() + dx
+        y = max(0, geometry.y() + dy) if dy < 0 else geometry.y() + dy
         
-        move_distance = 50
-        
-        if direction == "up":
-            y = max(0, y - move_distance)
-        elif direction == "down":
-            y += move_distance
-        elif direction == "left":
-            x = max(0, x - move_distance)
-        elif direction == "right":
-            x += move_distance
-            
         self.move(x, y)
         logger.info(f"Moved window {direction} to ({x}, {y})")
 
@@ -753,14 +765,14 @@ class MainWindow(QMainWindow):
         self.invisibility_manager.set_visibility(False)
         logger.info("Panic mode activated - window hidden")
 
+    @pyqtSlot()
     def toggle_web_server(self):
         """Toggle the web server on/off."""
         if not WEB_SERVER_AVAILABLE:
             return
 
         if self.web_server_thread and self.web_server_thread.isRunning():
-            self.web_server_thread.terminate()
-            self.web_server_thread.wait(3000)
+            self.web_server_thread.stop()
             self.status_bar_manager.update_web_server_status(False)
             self.status_bar_manager.show_message("Web server stopped")
         else:
@@ -770,16 +782,22 @@ class MainWindow(QMainWindow):
                 self.status_bar_manager.show_message("Web server started")
 
     # Dialog methods
+    @pyqtSlot()
     def show_settings(self):
         """Show the settings dialog."""
-        self.content_display.save_session_data()
+        self._save_session_data()
         
         dialog = SettingsDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            # Update services
+            # Update services; detach the old one so a late signal from it
+            # cannot reach these slots
+            self.llm_service.completion_finished.disconnect(self.on_solution_ready)
+            self.llm_service.error_occurred.disconnect(self.on_processing_error)
             self.llm_service = LLMService()
             self.llm_service.completion_finished.connect(self.on_solution_ready)
             self.llm_service.error_occurred.connect(self.on_processing_error)
+            if self.web_api:
+                self.web_api.set_services(self.llm_service, self.screenshot_manager)
 
             # Update UI
             index = self.screenshot_controls.language_combo.findText(settings.default_language)
@@ -788,16 +806,18 @@ class MainWindow(QMainWindow):
 
             self.set_always_on_top(settings.ui.always_on_top)
             self.action_bar.update_button_texts()
+            self.menu_manager.update_action_texts()
             self.hotkey_manager.register_hotkeys(self)
-            self.content_display.restore_session_data()
 
             self.status_bar_manager.show_message("Settings updated")
             logger.info("Settings updated")
 
+    @pyqtSlot()
     def _show_about(self):
         """Show the about dialog."""
         self.menu_manager.show_about_dialog()
 
+    @pyqtSlot()
     def _show_shortcuts(self):
         """Show the keyboard shortcuts dialog."""
         self.menu_manager.show_shortcuts_dialog()
@@ -805,15 +825,14 @@ class MainWindow(QMainWindow):
     # Permissions and system integration
     def check_and_request_permissions(self):
         """Check for and request required permissions."""
-        if platform.system() == "Darwin":
+        if _PLATFORM == "Darwin":
             self._check_macos_permissions()
-        elif platform.system() == "Windows":
+        elif _PLATFORM == "Windows":
             self._check_windows_permissions()
 
     def _check_macos_permissions(self):
         """Check macOS accessibility permissions."""
         try:
-            import Cocoa
             import HIServices
             
             trusted = HIServices.AXIsProcessTrusted()
@@ -835,10 +854,7 @@ class MainWindow(QMainWindow):
     def _check_windows_permissions(self):
         """Check Windows administrator permissions."""
         try:
-            import ctypes
-            
-            is_admin = ctypes.windll.shell32.IsUserAnAdmin()
-            if not is_admin:
+            if not _is_windows_admin():
                 msg = QMessageBox()
                 msg.setIcon(QMessageBox.Icon.Warning)
                 msg.setWindowTitle("Administrator Permission Required")
@@ -852,13 +868,16 @@ class MainWindow(QMainWindow):
     # Event handlers
     def closeEvent(self, event):
         """Handle window close event."""
-        if hasattr(self, 'web_server_thread') and self.web_server_thread and self.web_server_thread.isRunning():
+        self._save_session_data()
+        if self._settings_save_timer.isActive():
+            self._settings_save_timer.stop()
+            settings.save_user_settings()
+
+        if self.web_server_thread and self.web_server_thread.isRunning():
             logger.info("Stopping web server...")
-            self.web_server_thread.terminate()
-            self.web_server_thread.wait(3000)
+            self.web_server_thread.stop()
 
-        if hasattr(self, "hotkey_manager"):
-            self.hotkey_manager.stop_global_listener()
+        self.hotkey_manager.stop_global_listener()
 
         event.accept()
         logger.info("Application closed")
@@ -867,14 +886,21 @@ class MainWindow(QMainWindow):
     def changeEvent(self, event):
         """Handle window state changes."""
         if event.type() == QEvent.Type.WindowStateChange:
-            self.hotkey_manager.register_hotkeys(self)
-            logger.info("Re-registered hotkeys after window state change")
+            # Only a minimize/restore transition needs the hotkeys re-registered;
+            # maximize and fullscreen toggles leave them intact
+            was_minimized = bool(event.oldState() & Qt.WindowState.WindowMinimized)
+            is_minimized = bool(self.windowState() & Qt.WindowState.WindowMinimized)
+            if was_minimized != is_minimized:
+                self.hotkey_manager.register_hotkeys(self)
+                logger.info("Re-registered hotkeys after window state change")
         super().changeEvent(event)
 
     def resizeEvent(self, event):
         """Handle resize events."""
         super().resizeEvent(event)
-        self.content_display.save_session_data()
+        # Resize events arrive at mouse-move rate while dragging; snapshot
+        # once the drag settles
+        self._resize_save_timer.start()
 
     def showEvent(self, event):
         """Handle show events."""
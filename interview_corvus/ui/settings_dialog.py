@@ -1,5 +1,8 @@
+from functools import lru_cache
+from types import MappingProxyType
+
 from loguru import logger
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSignalBlocker, QThread, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -26,6 +29,88 @@ from interview_corvus.core.prompt_manager import PromptManager
 from interview_corvus.security.api_key_manager import APIKeyManager
 from interview_corvus.ui.hotkey_edit import HotkeyEdit
 
+# Models offered per provider; the first entry is the provider default
+_PROVIDER_MODELS = MappingProxyType({
+    "OpenAI": ("gpt-4o", "o3-mini", "gpt-4o-mini", "o1", "o1-mini"),
+    "Anthropic": ("claude-3-7-sonnet-latest", "claude-3-5-haiku-latest"),
+})
+
+# (model name fragment, provider) pairs; anything unmatched is OpenAI
+_MODEL_PREFIX_TO_PROVIDER = (
+    ("claude", "Anthropic"),
+    ("anthropic", "Anthropic"),
+)
+
+
+def _provider_for_model(model: str) -> str:
+    """Return the provider serving the given model name."""
+    for prefix, provider in _MODEL_PREFIX_TO_PROVIDER:
+        if prefix in model:
+            return provider
+    return "OpenAI"
+
+
+# (settings.hotkeys field, row label) for the main hotkey editors
+_MAIN_HOTKEYS = (
+    ("screenshot_key", "Take Screenshot"),
+    ("generate_solution_key", "Generate Solution"),
+    ("toggle_visibility_key", "Toggle Visibility"),
+    ("optimize_solution_key", "Optimize Solution"),
+    ("reset_history_key", "Reset History"),
+    ("panic_key", "Panic (Instant Hide)"),
+)
+_MOVE_DIRECTIONS = ("up", "down", "left", "right")
+
+
+@lru_cache(maxsize=1)
+def _default_prompt_templates() -> dict:
+    """Built-in prompt templates; PromptTemplates re-reads the environment on each init."""
+    return PromptTemplates().templates
+
+
+class ConnectionTestThread(QThread):
+    """Thread that sends a single test request to the LLM provider."""
+
+    succeeded = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, provider: str, model: str, api_key: str, parent=None):
+        """
+        Args:
+            provider: Provider name as shown in the settings dialog
+            model: Model to send the test request to
+            api_key: API key to authenticate with
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.provider = provider
+        self.model = model
+        self.api_key = api_key
+
+    def run(self):
+        try:
+            # Import appropriate library based on provider
+            if self.provider == "OpenAI":
+                from openai import OpenAI
+
+                # Looking the model up checks both the key and the model name
+                # without waiting for a completion
+                client = OpenAI(api_key=self.api_key)
+                client.models.retrieve(self.model)
+            else:  # Anthropic
+                from anthropic import Anthropic
+
+                # A one-token reply is enough to prove the key works
+                client = Anthropic(api_key=self.api_key)
+                client.messages.create(
+                    model=self.model,
+                    max_tokens=1,
+                    messages=[{"role": "user", "content": "Hello, are you working?"}],
+                )
+            self.succeeded.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+
 
 class SettingsDialog(QDialog):
     """
@@ -41,13 +126,28 @@ class SettingsDialog(QDialog):
         """
         super().__init__(parent)
 
-        self.api_key_manager = APIKeyManager()
-        self.prompt_manager = PromptManager()
+        # Created on first use; only the LLM and Prompts tabs need them
+        self._api_key_manager = None
+        self._prompt_manager = None
 
         self.setWindowTitle("Settings")
         self.setup_ui()
         self.load_settings()
 
+    @property
+    def api_key_manager(self) -> APIKeyManager:
+        """The API key manager, created on first access."""
+        if self._api_key_manager is None:
+            self._api_key_manager = APIKeyManager()
+        return self._api_key_manager
+
+    @property
+    def prompt_manager(self) -> PromptManager:
+        """The prompt manager, created on first access."""
+        if self._prompt_manager is None:
+            self._prompt_manager = PromptManager()
+        return self._prompt_manager
+
     def setup_ui(self):
         """Set up the user interface."""
         layout = QVBoxLayout(self)
@@ -65,6 +165,9 @@ class SettingsDialog(QDialog):
 
         self.language_combo = QComboBox()
         self.language_combo.addItems(settings.available_languages)
+        self._language_index = {
+            name: i for i, name in enumerate(settings.available_languages)
+        }
         language_layout.addRow("Default Language:", self.language_combo)
 
         language_group.setLayout(language_layout)
@@ -83,22 +186,12 @@ class SettingsDialog(QDialog):
 
         # API Provider
         self.provider_combo = QComboBox()
-        self.provider_combo.addItems(["OpenAI", "Anthropic"])
+        self.provider_combo.addItems(list(_PROVIDER_MODELS))
         self.provider_combo.currentTextChanged.connect(self.on_provider_changed)
         llm_form_layout.addRow("API Provider:", self.provider_combo)
 
-        # Model selection
+        # Model selection, populated for the provider in load_settings
         self.model_combo = QComboBox()
-        # OpenAI models by default
-        self.model_combo.addItems(
-            [
-                "gpt-4o",
-                "o3-mini",
-                "gpt-4o-mini",
-                "o1",
-                "o1-mini",
-            ]
-        )
         llm_form_layout.addRow("Model:", self.model_combo)
 
         # API Key
@@ -131,8 +224,43 @@ class SettingsDialog(QDialog):
         # Add the LLM tab
         self.tab_widget.addTab(llm_tab, "LLM Settings")
 
-        # Prompts tab
+        # Prompts tab, filled in when first opened
         prompts_tab = QWidget()
+        self.tab_widget.addTab(prompts_tab, "Prompts")
+
+        # Add tab widget to main layout
+        layout.addWidget(self.tab_widget)
+
+        # Buttons
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        button_box.accepted.connect(self.save_settings)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+        self.setMinimumWidth(500)
+        self.setMinimumHeight(400)
+
+        # Hotkeys tab, filled in when first opened
+        hotkeys_tab = QWidget()
+        self.tab_widget.addTab(hotkeys_tab, "Hotkeys")
+
+        # Per-tab work deferred until the tab is first shown
+        self._tab_builders = {
+            llm_tab: self._load_api_key,
+            prompts_tab: lambda: self._build_prompts_tab(prompts_tab),
+            hotkeys_tab: lambda: self._build_hotkeys_tab(hotkeys_tab),
+        }
+        # Hotkey editors keyed by settings field / move direction
+        self.hotkey_edits = {}
+        self.move_hotkey_edits = {}
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+
+    def _build_prompts_tab(self, prompts_tab):
+        """Create the prompt template editor."""
+        # The tab is already on screen; paint it once, fully laid out
+        prompts_tab.setUpdatesEnabled(False)
         prompts_layout = QVBoxLayout(prompts_tab)
 
         # Prompt editor
@@ -166,84 +294,31 @@ class SettingsDialog(QDialog):
 
         prompt_group.setLayout(prompt_layout)
         prompts_layout.addWidget(prompt_group)
+        prompts_tab.setUpdatesEnabled(True)
 
-        # Add the prompts tab
-        self.tab_widget.addTab(prompts_tab, "Prompts")
-
-        # Add tab widget to main layout
-        layout.addWidget(self.tab_widget)
-
-        # Buttons
-        button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        button_box.accepted.connect(self.save_settings)
-        button_box.rejected.connect(self.reject)
-        layout.addWidget(button_box)
-
-        self.setMinimumWidth(500)
-        self.setMinimumHeight(400)
-
-        hotkeys_tab = QWidget()
+    def _build_hotkeys_tab(self, hotkeys_tab):
+        """Create the hotkey editors."""
+        # The tab is already on screen; paint it once, fully laid out
+        hotkeys_tab.setUpdatesEnabled(False)
         hotkeys_layout = QVBoxLayout(hotkeys_tab)
 
         # Group for main hotkeys
         main_hotkeys_group = QGroupBox("Main Hotkeys")
         main_hotkeys_layout = QFormLayout()
-
-        # Screenshot hotkey
-        self.screenshot_hotkey = HotkeyEdit(settings.hotkeys.screenshot_key)
-        main_hotkeys_layout.addRow("Take Screenshot:", self.screenshot_hotkey)
-
-        # Generate solution hotkey
-        self.generate_solution_hotkey = HotkeyEdit(
-            settings.hotkeys.generate_solution_key
-        )
-        main_hotkeys_layout.addRow("Generate Solution:", self.generate_solution_hotkey)
-
-        # Toggle visibility hotkey
-        self.toggle_visibility_hotkey = HotkeyEdit(
-            settings.hotkeys.toggle_visibility_key
-        )
-        main_hotkeys_layout.addRow("Toggle Visibility:", self.toggle_visibility_hotkey)
-
-        # Optimize solution hotkey
-        self.optimize_solution_hotkey = HotkeyEdit(
-            settings.hotkeys.optimize_solution_key
-        )
-        main_hotkeys_layout.addRow("Optimize Solution:", self.optimize_solution_hotkey)
-
-        # Reset history hotkey
-        self.reset_history_hotkey = HotkeyEdit(settings.hotkeys.reset_history_key)
-        main_hotkeys_layout.addRow("Reset History:", self.reset_history_hotkey)
-
-        # Panic hotkey
-        self.panic_hotkey = HotkeyEdit(settings.hotkeys.panic_key)
-        main_hotkeys_layout.addRow("Panic (Instant Hide):", self.panic_hotkey)
-
+        for field, label in _MAIN_HOTKEYS:
+            edit = HotkeyEdit(getattr(settings.hotkeys, field))
+            self.hotkey_edits[field] = edit
+            main_hotkeys_layout.addRow(f"{label}:", edit)
         main_hotkeys_group.setLayout(main_hotkeys_layout)
         hotkeys_layout.addWidget(main_hotkeys_group)
 
         # Group for window movement hotkeys
         move_hotkeys_group = QGroupBox("Window Movement Hotkeys")
         move_hotkeys_layout = QFormLayout()
-
-        # Move window up hotkey
-        self.move_up_hotkey = HotkeyEdit(settings.hotkeys.move_window_keys["up"])
-        move_hotkeys_layout.addRow("Move Window Up:", self.move_up_hotkey)
-
-        # Move window down hotkey
-        self.move_down_hotkey = HotkeyEdit(settings.hotkeys.move_window_keys["down"])
-        move_hotkeys_layout.addRow("Move Window Down:", self.move_down_hotkey)
-
-        # Move window left hotkey
-        self.move_left_hotkey = HotkeyEdit(settings.hotkeys.move_window_keys["left"])
-        move_hotkeys_layout.addRow("Move Window Left:", self.move_left_hotkey)
-
-        # Move window right hotkey
-        self.move_right_hotkey = HotkeyEdit(settings.hotkeys.move_window_keys["right"])
-        move_hotkeys_layout.addRow("Move Window Right:", self.move_right_hotkey)
-
+        for direction in _MOVE_DIRECTIONS:
+            edit = HotkeyEdit(settings.hotkeys.move_window_keys[direction])
+            self.move_hotkey_edits[direction] = edit
+            move_hotkeys_layout.addRow(f"Move Window {direction.capitalize()}:", edit)
         move_hotkeys_group.setLayout(move_hotkeys_layout)
         hotkeys_layout.addWidget(move_hotkeys_group)
 
@@ -263,29 +338,52 @@ class SettingsDialog(QDialog):
 
         # Add spacer
         hotkeys_layout.addStretch()
-
-        # Add the hotkeys tab
-        self.tab_widget.addTab(hotkeys_tab, "Hotkeys")
+        hotkeys_tab.setUpdatesEnabled(True)
 
     def load_settings(self):
         """Load current settings into the UI."""
         # Default programming language
-        index = self.language_combo.findText(settings.default_language)
-        if index >= 0:
+        index = self._language_index.get(settings.default_language)
+        if index is not None:
             self.language_combo.setCurrentIndex(index)
 
-        # Default to OpenAI
-        self.provider_combo.setCurrentText("OpenAI")
+        # Select the provider serving the configured model and fill the model
+        # list for it exactly once
+        llm = settings.llm
+        provider = _provider_for_model(llm.model)
+        with QSignalBlocker(self.provider_combo):
+            self.provider_combo.setCurrentText(provider)
+        self.on_provider_changed(provider)
 
         # LLM settings
-        self.model_combo.setCurrentText(settings.llm.model)
-        self.temperature_input.setValue(settings.llm.temperature)
-
+        index = self._model_index.get(llm.model)
+        if index is not None:
+            self.model_combo.setCurrentIndex(index)
+        self.temperature_input.setValue(llm.temperature)
+
+        # The API key is read from the keyring only once the LLM tab is shown
+        self._loaded_api_key = ""
+
+        # Compared against on save to skip writing unchanged settings
+        self._loaded_user_settings = settings.user_settings_snapshot()
+
+    @pyqtSlot(int)
+    def _on_tab_changed(self, index):
+        """Run the deferred setup for a tab the first time it is shown."""
+        builder = self._tab_builders.pop(self.tab_widget.widget(index), None)
+        if builder is not None:
+            builder()
+        if not self._tab_builders:
+            self.tab_widget.currentChanged.disconnect(self._on_tab_changed)
+
+    def _load_api_key(self):
+        """Load the stored API key into the LLM tab."""
         # Get API key if it exists
         try:
             api_key = self.api_key_manager.get_api_key()
             if api_key:
                 self.api_key_input.setText(api_key)
+                self._loaded_api_key = api_key
         except (ValueError, Exception) as e:
             logger.info(f"Could not load API key: {e}")
             # No API key exists
@@ -296,52 +394,38 @@ class SettingsDialog(QDialog):
         settings.default_language = self.language_combo.currentText()
 
         # Save LLM settings
-        settings.llm.model = self.model_combo.currentText()
-        settings.llm.temperature = self.temperature_input.value()
-
-        if self.screenshot_hotkey.text():
-            settings.hotkeys.screenshot_key = self.screenshot_hotkey.text()
-        if self.generate_solution_hotkey.text():
-            settings.hotkeys.generate_solution_key = (
-                self.generate_solution_hotkey.text()
-            )
-        if self.toggle_visibility_hotkey.text():
-            settings.hotkeys.toggle_visibility_key = (
-                self.toggle_visibility_hotkey.text()
-            )
-        if self.optimize_solution_hotkey.text():
-            settings.hotkeys.optimize_solution_key = (
-                self.optimize_solution_hotkey.text()
-            )
-        if self.reset_history_hotkey.text():
-            settings.hotkeys.reset_history_key = self.reset_history_hotkey.text()
-        if self.panic_hotkey.text():
-            settings.hotkeys.panic_key = self.panic_hotkey.text()
-
-            # Save move window hotkeys
-        move_window_keys = settings.hotkeys.move_window_keys.copy()
-        if self.move_up_hotkey.text():
-            move_window_keys["up"] = self.move_up_hotkey.text()
-        if self.move_down_hotkey.text():
-            move_window_keys["down"] = self.move_down_hotkey.text()
-        if self.move_left_hotkey.text():
-            move_window_keys["left"] = self.move_left_hotkey.text()
-        if self.move_right_hotkey.text():
-            move_window_keys["right"] = self.move_right_hotkey.text()
-        settings.hotkeys.move_window_keys = move_window_keys
-
-        # Save API key
+        llm = settings.llm
+        llm.model = self.model_combo.currentText()
+        llm.temperature = self.temperature_input.value()
+
+        # Hotkey editors only exist once the Hotkeys tab has been opened;
+        # empty editors keep the current hotkey
+        hotkeys = settings.hotkeys
+        for field, edit in self.hotkey_edits.items():
+            text = edit.text()
+            if text:
+                setattr(hotkeys, field, text)
+        if self.move_hotkey_edits:
+            move_window_keys = hotkeys.move_window_keys.copy()
+            for direction, edit in self.move_hotkey_edits.items():
+                text = edit.text()
+                if text:
+                    move_window_keys[direction] = text
+            hotkeys.move_window_keys = move_window_keys
+
+        # Save API key; keyring writes can be slow, so only when it changed
         api_key = self.api_key_input.text().strip()
-        if api_key:
+        if api_key and api_key != self._loaded_api_key:
             try:
                 self.api_key_manager.set_api_key(api_key)
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Error saving API key: {e}")
 
-        try:
-            settings.save_user_settings()
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Error saving settings: {e}")
+        if settings.user_settings_snapshot() != self._loaded_user_settings:
+            try:
+                settings.save_user_settings()
+            except Exception as e:
+                QMessageBox.warning(self, "Error", f"Error saving settings: {e}")
 
         # Close dialog
         self.accept()
@@ -353,30 +437,17 @@ class SettingsDialog(QDialog):
         Args:
             provider: The selected provider name
         """
-        self.model_combo.clear()
-
-        if provider == "OpenAI":
-            self.model_combo.addItems(
-                [
-                    "gpt-4o",
-                    "o3-mini",
-                    "gpt-4o-mini",
-                    "o1",
-                    "o1-mini",
-                ]
-            )
-            self.api_key_input.setPlaceholderText("Enter OpenAI API key")
-        elif provider == "Anthropic":
-            self.model_combo.addItems(
-                ["claude-3-7-sonnet-latest", "claude-3-5-haiku-latest"]
-            )
-            self.api_key_input.setPlaceholderText("Enter Anthropic API key")
-
+        models = _PROVIDER_MODELS.get(provider, ())
+        self._model_index = {name: i for i, name in enumerate(models)}
+        # Repopulate silently; the combo reports one change once the default is set
+        with QSignalBlocker(self.model_combo):
+            self.model_combo.clear()
+            self.model_combo.addItems(models)
+            self.model_combo.setCurrentIndex(-1)
+        if models:
             # Set default model based on provider
-        if provider == "OpenAI":
-            self.model_combo.setCurrentText("gpt-4o")  # Set default to o3-mini
-        else:
-            self.model_combo.setCurrentText("claude-3-7-sonnet-latest")
+            self.model_combo.setCurrentIndex(0)
+        self.api_key_input.setPlaceholderText(f"Enter {provider} API key")
 
     def toggle_api_key_visibility(self, state):
         """
@@ -397,46 +468,38 @@ class SettingsDialog(QDialog):
             QMessageBox.warning(self, "Error", "Please enter an API key.")
             return
 
-        # Temporarily save API key for testing
-        try:
-            old_api_key = self.api_key_manager.get_api_key()
-            self.api_key_manager.set_api_key(api_key)
-
-            self.test_connection_button.setEnabled(False)
-            self.test_connection_button.setText("Checking connection...")
-            QApplication.processEvents()  # Update UI
-
-            # Import appropriate library based on provider
-            if self.provider_combo.currentText() == "OpenAI":
-                from openai import OpenAI
+        self.test_connection_button.setEnabled(False)
+        self.test_connection_button.setText("Checking connection...")
 
-                client = OpenAI(api_key=api_key)
-                client.chat.completions.create(
-                    model=self.model_combo.currentText(),
-                    messages=[{"role": "user", "content": "Hello, are you working?"}],
-                )
-            else:  # Anthropic
-                from anthropic import Anthropic
-
-                client = Anthropic(api_key=api_key)
-                client.messages.create(
-                    model=self.model_combo.currentText(),
-                    messages=[{"role": "user", "content": "Hello, are you working?"}],
-                )
-
-            if old_api_key:
-                self.api_key_manager.set_api_key(old_api_key)
-
-            QMessageBox.information(self, "Success", "Connection successful!")
-
-        except Exception as e:
-            if old_api_key:
-                self.api_key_manager.set_api_key(old_api_key)
-
-            QMessageBox.critical(self, "Error", f"Cannot connect to API: {str(e)}")
-        finally:
-            self.test_connection_button.setEnabled(True)
-            self.test_connection_button.setText("Check connection")
+        # Owned by the application so closing the dialog mid-check doesn't
+        # destroy a running thread; the dialog's slots disconnect with it
+        thread = ConnectionTestThread(
+            self.provider_combo.currentText(),
+            self.model_combo.currentText(),
+            api_key,
+            QApplication.instance(),
+        )
+        thread.succeeded.connect(self._on_connection_succeeded)
+        thread.failed.connect(self._on_connection_failed)
+        thread.finished.connect(thread.deleteLater)
+        thread.start()
+
+    @pyqtSlot()
+    def _on_connection_succeeded(self):
+        """Report a successful connection test."""
+        self._reset_test_connection_button()
+        QMessageBox.information(self, "Success", "Connection successful!")
+
+    @pyqtSlot(str)
+    def _on_connection_failed(self, error):
+        """Report a failed connection test."""
+        self._reset_test_connection_button()
+        QMessageBox.critical(self, "Error", f"Cannot connect to API: {error}")
+
+    def _reset_test_connection_button(self):
+        """Re-enable the connection test button."""
+        self.test_connection_button.setEnabled(True)
+        self.test_connection_button.setText("Check connection")
 
     def on_prompt_selected(self, template_name):
         """
@@ -452,7 +515,7 @@ class SettingsDialog(QDialog):
 
         try:
             template_text = self.prompt_manager.get_template(template_name)
-            self.prompt_editor.setText(template_text)
+            self.prompt_editor.setPlainText(template_text)
         except ValueError as e:
             QMessageBox.warning(self, "Error", str(e))
 
@@ -499,10 +562,10 @@ class SettingsDialog(QDialog):
             return
 
         # Get default template from initial settings
-        default_templates = PromptTemplates().templates
+        default_templates = _default_prompt_templates()
         if template_name in default_templates:
             default_template = default_templates[template_name]
-            self.prompt_editor.setText(default_template)
+            self.prompt_editor.setPlainText(default_template)
             self.prompt_manager.update_template(template_name, default_template)
             QMessageBox.information(
                 self, "Success", f"Template '{template_name}' reset to default"
@@ -515,20 +578,15 @@ class SettingsDialog(QDialog):
     def reset_hotkeys(self):
         """Reset hotkeys to their default values."""
         # Reset to defaults
-        settings.hotkeys.reset_to_defaults()
+        hotkeys = settings.hotkeys
+        hotkeys.reset_to_defaults()
 
         # Update UI with defaults
-        self.screenshot_hotkey.setText(settings.hotkeys.screenshot_key)
-        self.generate_solution_hotkey.setText(settings.hotkeys.generate_solution_key)
-        self.toggle_visibility_hotkey.setText(settings.hotkeys.toggle_visibility_key)
-        self.optimize_solution_hotkey.setText(settings.hotkeys.optimize_solution_key)
-        self.reset_history_hotkey.setText(settings.hotkeys.reset_history_key)
-        self.panic_hotkey.setText(settings.hotkeys.panic_key)
-
-        self.move_up_hotkey.setText(settings.hotkeys.move_window_keys["up"])
-        self.move_down_hotkey.setText(settings.hotkeys.move_window_keys["down"])
-        self.move_left_hotkey.setText(settings.hotkeys.move_window_keys["left"])
-        self.move_right_hotkey.setText(settings.hotkeys.move_window_keys["right"])
+        for field, edit in self.hotkey_edits.items():
+            edit.setText(getattr(hotkeys, field))
+        move_window_keys = hotkeys.move_window_keys
+        for direction, edit in self.move_hotkey_edits.items():
+            edit.setText(move_window_keys[direction])
 
         QMessageBox.information(
             self, "Reset Hotkeys", "Hotkeys have been reset to default values."
@@ -1,7 +1,8 @@
 """UI styles and themes for the application."""
 
 from enum import Enum
-from typing import Dict
+from types import MappingProxyType
+from typing import ClassVar, Dict, Mapping
 
 from interview_corvus.config import settings
 
@@ -13,11 +14,81 @@ class Theme(Enum):
     DARK = "dark"
 
 
+# Base styles (shared between themes)
+BASE_STYLES = MappingProxyType(
+    {
+        "font_family": "Consolas, 'Courier New', monospace",
+        "font_size": f"{settings.ui.default_font_size}pt",
+        "font_code": "Consolas, 'Source Code Pro', monospace",
+        "border_radius": "4px",
+        "padding": "8px",
+    }
+)
+
+# Light theme
+LIGHT_THEME = MappingProxyType(
+    {
+        "window_bg": "#F8F8F8",
+        "panel_bg": "#FFFFFF",
+        "text_color": "#333333",
+        "code_bg": "#F5F5F5",
+        "accent_color": "#007AFF",
+        "button_bg": "#E0E0E0",
+        "button_text": "#333333",
+        "highlight_color": "#FFD700",
+        "border_color": "#DDDDDD",
+    }
+)
+
+# Dark theme
+DARK_THEME = MappingProxyType(
+    {
+        "window_bg": "#1E1E1E",
+        "panel_bg": "#252526",
+        "text_color": "#CCCCCC",
+        "code_bg": "#2D2D2D",
+        "accent_color": "#0A84FF",
+        "button_bg": "#3A3A3A",
+        "button_text": "#FFFFFF",
+        "highlight_color": "#FFD700",
+        "border_color": "#555555",
+    }
+)
+
+# Syntax highlighting for code
+SYNTAX_LIGHT = MappingProxyType(
+    {
+        "keyword": "#0000FF",  # blue
+        "string": "#008000",  # green
+        "comment": "#808080",  # gray
+        "function": "#800000",  # maroon
+        "number": "#FF8000",  # orange
+        "class": "#800080",  # purple
+        "background": "#FFFFFF",  # white
+    }
+)
+
+SYNTAX_DARK = MappingProxyType(
+    {
+        "keyword": "#569CD6",  # blue
+        "string": "#CE9178",  # brownish
+        "comment": "#6A9955",  # green
+        "function": "#DCDCAA",  # yellow
+        "number": "#B5CEA8",  # light green
+        "class": "#4EC9B0",  # teal
+        "background": "#1E1E1E",  # dark gray
+    }
+)
+
+
 class Styles:
     """
     Manages styles and themes for the application UI.
     """
 
+    # Rendered stylesheet per theme name, shared by all instances
+    _stylesheet_cache: ClassVar[Dict[str, str]] = {}
+
     def __init__(self, theme: str = None):
         """
         Initialize styles with specified theme.
@@ -26,89 +97,24 @@ class Styles:
             theme: Theme name ("light" or "dark"), defaults to settings value
         """
         self.theme = theme or settings.ui.default_theme
-        self._initialize_styles()
-
-    def _initialize_styles(self) -> None:
-        """Initialize style dictionaries for themes."""
-        # Base styles (shared between themes)
-        self.base_styles = {
-            "font_family": "Consolas, 'Courier New', monospace",
-            "font_size": f"{settings.ui.default_font_size}pt",
-            "font_code": "Consolas, 'Source Code Pro', monospace",
-            "border_radius": "4px",
-            "padding": "8px",
-        }
-
-        # Light theme
-        self.light_theme = {
-            "window_bg": "#F8F8F8",
-            "panel_bg": "#FFFFFF",
-            "text_color": "#333333",
-            "code_bg": "#F5F5F5",
-            "accent_color": "#007AFF",
-            "button_bg": "#E0E0E0",
-            "button_text": "#333333",
-            "highlight_color": "#FFD700",
-            "border_color": "#DDDDDD",
-        }
-
-        # Dark theme
-        self.dark_theme = {
-            "window_bg": "#1E1E1E",
-            "panel_bg": "#252526",
-            "text_color": "#CCCCCC",
-            "code_bg": "#2D2D2D",
-            "accent_color": "#0A84FF",
-            "button_bg": "#3A3A3A",
-            "button_text": "#FFFFFF",
-            "highlight_color": "#FFD700",
-            "border_color": "#555555",
-        }
-
-        # Syntax highlighting for code
-        self.syntax_light = {
-            "keyword": "#0000FF",  # blue
-            "string": "#008000",  # green
-            "comment": "#808080",  # gray
-            "function": "#800000",  # maroon
-            "number": "#FF8000",  # orange
-            "class": "#800080",  # purple
-            "background": "#FFFFFF",  # white
-        }
-
-        self.syntax_dark = {
-            "keyword": "#569CD6",  # blue
-            "string": "#CE9178",  # brownish
-            "comment": "#6A9955",  # green
-            "function": "#DCDCAA",  # yellow
-            "number": "#B5CEA8",  # light green
-            "class": "#4EC9B0",  # teal
-            "background": "#1E1E1E",  # dark gray
-        }
-
-    def get_theme_colors(self) -> Dict[str, str]:
+
+    def get_theme_colors(self) -> Mapping[str, str]:
         """
         Get the colors for the current theme.
 
         Returns:
             Dictionary of color properties
         """
-        if self.theme == Theme.LIGHT.value:
-            return self.light_theme
-        else:
-            return self.dark_theme
+        return LIGHT_THEME if self.theme == Theme.LIGHT.value else DARK_THEME
 
-    def get_syntax_colors(self) -> Dict[str, str]:
+    def get_syntax_colors(self) -> Mapping[str, str]:
         """
         Get the syntax highlighting colors for the current theme.
 
         Returns:
             Dictionary of syntax highlighting colors
         """
-        if self.theme == Theme.LIGHT.value:
-            return self.syntax_light
-        else:
-            return self.syntax_dark
+        return SYNTAX_LIGHT if self.theme == Theme.LIGHT.value else SYNTAX_DARK
 
     def get_stylesheet(self) -> str:
         """
@@ -117,8 +123,16 @@ class Styles:
         Returns:
             CSS-like stylesheet string for Qt
         """
+        stylesheet = self._stylesheet_cache.get(self.theme)
+        if stylesheet is None:
+            stylesheet = self._render_stylesheet()
+            self._stylesheet_cache[self.theme] = stylesheet
+        return stylesheet
+
+    def _render_stylesheet(self) -> str:
+        """Render the Qt stylesheet for the current theme."""
         theme = self.get_theme_colors()
-        base = self.base_styles
+        base = BASE_STYLES
 
         return f"""
         QWidget {{
@@ -4,17 +4,22 @@
 Собирает все необходимые файлы для релиза на GitHub.
 """
 
+import hashlib
 import os
 import shutil
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_version():
     """Получить версию приложения."""
-    sys.path.append(os.path.abspath("."))
+    project_dir = os.path.abspath(".")
+    if project_dir not in sys.path:
+        sys.path.append(project_dir)
     from interview_corvus import __version__
 
     return __version__
@@ -28,6 +33,31 @@ def create_release_dir():
     return release_dir
 
 
+# copy_file_range есть только в Linux
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+
+def fast_copy(src, dst):
+    """Скопировать файл средствами ядра, если это возможно, вместе с метаданными."""
+    copied = False
+    if _HAS_COPY_FILE_RANGE:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    size = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if size == 0:
+                        break
+                    remaining -= size
+            copied = remaining == 0
+        except OSError:
+            # Старое ядро или файловая система без поддержки
+            copied = False
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
 def copy_release_files(release_dir):
     """Копировать файлы релиза."""
     # Копируем все файлы из dist
@@ -38,15 +68,33 @@ def copy_release_files(release_dir):
         sys.exit(1)
 
     # Копируем все файлы релиза
-    for file_path in dist_dir.glob("Interview_Corvus-*"):
-        if file_path.is_file():
-            print(f"Копирование {file_path} -> {release_dir / file_path.name}")
-            shutil.copy2(file_path, release_dir / file_path.name)
+    with os.scandir(dist_dir) as entries:
+        for entry in entries:
+            # DirEntry уже знает тип файла, отдельный stat не нужен
+            if not entry.name.startswith("Interview_Corvus-") or not entry.is_file():
+                continue
+            destination = release_dir / entry.name
+            print(f"Копирование {entry.path} -> {destination}")
+            fast_copy(entry.path, destination)
 
     # Копируем README и другие важные файлы
     for file_name in ["README.md", "LICENSE"]:
         if Path(file_name).exists():
-            shutil.copy2(file_name, release_dir / file_name)
+            fast_copy(file_name, release_dir / file_name)
+
+
+def file_checksums(file_path):
+    """Посчитать MD5 и SHA256 файла за одно чтение."""
+    md5 = hashlib.md5()
+    sha256 = hashlib.sha256()
+    # Один переиспользуемый буфер без промежуточных копий
+    buffer = bytearray(1 << 20)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            md5.update(view[:size])
+            sha256.update(view[:size])
+    return md5.hexdigest(), sha256.hexdigest()
 
 
 def create_checksums(release_dir):
@@ -57,25 +105,17 @@ def create_checksums(release_dir):
         f.write(f"# Interview Corvus {get_version()} checksums\n")
         f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
-        for file_path in release_dir.glob("Interview_Corvus-*"):
-            if file_path.is_file():
-                # MD5
-                md5 = subprocess.check_output(
-                    ["md5sum" if sys.platform != "darwin" else "md5", str(file_path)],
-                    text=True,
-                ).split()[0]
-
-                # SHA256
-                sha256 = subprocess.check_output(
-                    [
-                        "sha256sum" if sys.platform != "darwin" else "shasum",
-                        "-a",
-                        "256",
-                        str(file_path),
-                    ],
-                    text=True,
-                ).split()[0]
+        files = sorted(
+            file_path
+            for file_path in release_dir.glob("Interview_Corvus-*")
+            if file_path.is_file()
+        )
+
+        # Файлы независимы, а hashlib отпускает GIL, поэтому считаем параллельно
+        with ThreadPoolExecutor(max_workers=max(len(files), 1)) as executor:
+            checksums = executor.map(file_checksums, files)
 
+            for file_path, (md5, sha256) in zip(files, checksums):
                 f.write(f"{file_path.name}:\n")
                 f.write(f"  MD5: {md5}\n")
                 f.write(f"  SHA256: {sha256}\n\n")
@@ -84,81 +124,91 @@ def create_checksums(release_dir):
 def create_release_notes(release_dir):
     """Создать файл с заметками о релизе."""
     version = get_version()
+    release_date = datetime.now().strftime("%Y-%m-%d")
 
-    with open(release_dir / "RELEASE_NOTES.md", "w") as f:
-        f.write(f"# Interview Corvus {version} Release Notes\n\n")
-        f.write(f"Release Date: {datetime.now().strftime('%Y-%m-%d')}\n\n")
-
-        f.write("## Что нового\n\n")
-        f.write("- Первый публичный релиз\n")
-        f.write("- Поддержка Windows, macOS и Linux\n\n")
-
-        f.write("## Системные требования\n\n")
-        f.write("### Windows\n")
-        f.write("- Windows 10 или более новая версия\n")
-        f.write("- 4 ГБ ОЗУ (рекомендуется 8 ГБ)\n")
-        f.write("- 500 МБ свободного места на диске\n\n")
-
-        f.write("### macOS\n")
-        f.write("- macOS Catalina (10.15) или более новая версия\n")
-        f.write("- 4 ГБ ОЗУ (рекомендуется 8 ГБ)\n")
-        f.write("- 500 МБ свободного места на диске\n\n")
-
-        f.write("### Linux\n")
-        f.write("- Современный дистрибутив Linux (Ubuntu 20.04+, Fedora 34+, и т.д.)\n")
-        f.write("- 4 ГБ ОЗУ (рекомендуется 8 ГБ)\n")
-        f.write("- 500 МБ свободного места на диске\n")
-        f.write("- X11 или Wayland с Qt поддержкой\n\n")
-
-        f.write("## Установка\n\n")
-        f.write("### Windows\n")
-        f.write("1. Распакуйте ZIP-архив\n")
-        f.write("2. Запустите `Interview Corvus.exe`\n\n")
-
-        f.write("### macOS\n")
-        f.write("1. Смонтируйте DMG-образ\n")
-        f.write("2. Перетащите `Interview Corvus.app` в папку Applications\n")
-        f.write(
-            "3. При первом запуске: Ctrl+клик по приложению, выберите 'Открыть'\n\n"
-        )
+    content = f"""\
+# Interview Corvus {version} Release Notes
+
+Release Date: {release_date}
+
+## Что нового
+
+- Первый публичный релиз
+- Поддержка Windows, macOS и Linux
+
+## Системные требования
+
+### Windows
+- Windows 10 или более новая версия
+- 4 ГБ ОЗУ (рекомендуется 8 ГБ)
+- 500 МБ свободного места на диске
+
+### macOS
+- macOS Catalina (10.15) или более новая версия
+- 4 ГБ ОЗУ (рекомендуется 8 ГБ)
+- 500 МБ свободного места на диске
 
-        f.write("### Linux\n")
-        f.write("1. Распакуйте архив: `tar -xzf Interview_Corvus-*-Linux.tar.gz`\n")
-        f.write("2. Запустите: `./interview-corvus/interview-corvus`\n\n")
+### Linux
+- Современный дистрибутив Linux (Ubuntu 20.04+, Fedora 34+, и т.д.)
+- 4 ГБ ОЗУ (рекомендуется 8 ГБ)
+- 500 МБ свободного места на диске
+- X11 или Wayland с Qt поддержкой
 
-        f.write("## Известные проблемы\n\n")
-        f.write("- Для корректной работы требуется API ключ OpenAI\n")
+## Установка
+
+### Windows
+1. Распакуйте ZIP-архив
+2. Запустите `Interview Corvus.exe`
+
+### macOS
+1. Смонтируйте DMG-образ
+2. Перетащите `Interview Corvus.app` в папку Applications
+3. При первом запуске: Ctrl+клик по приложению, выберите 'Открыть'
+
+### Linux
+1. Распакуйте архив: `tar -xzf Interview_Corvus-*-Linux.tar.gz`
+2. Запустите: `./interview-corvus/interview-corvus`
+
+## Известные проблемы
+
+- Для корректной работы требуется API ключ OpenAI
+"""
+
+    (release_dir / "RELEASE_NOTES.md").write_text(content, encoding="utf-8")
 
 
 def create_github_release_template(release_dir):
     """Создать шаблон для релиза на GitHub."""
     version = get_version()
 
-    with open(release_dir / "GITHUB_RELEASE_TEMPLATE.md", "w") as f:
-        f.write(f"# Interview Corvus {version}\n\n")
-        f.write(
-            "Interview Corvus - невидимый помощник с искусственным интеллектом для технических собеседований.\n\n"
-        )
+    content = f"""\
+# Interview Corvus {version}
 
-        f.write("## Загрузки\n\n")
-        f.write("- [Windows (.zip)](link-to-windows-zip)\n")
-        f.write("- [macOS (.dmg)](link-to-macos-dmg)\n")
-        f.write("- [Linux (.tar.gz)](link-to-linux-tar-gz)\n\n")
+Interview Corvus - невидимый помощник с искусственным интеллектом для технических собеседований.
 
-        f.write("SHA-256 контрольные суммы доступны в файле `checksums.txt`\n\n")
+## Загрузки
 
-        f.write("## Что нового\n\n")
-        f.write("- Первый публичный релиз\n")
-        f.write("- Поддержка Windows, macOS и Linux\n\n")
+- [Windows (.zip)](link-to-windows-zip)
+- [macOS (.dmg)](link-to-macos-dmg)
+- [Linux (.tar.gz)](link-to-linux-tar-gz)
 
-        f.write("## Системные требования\n\n")
-        f.write("- Windows 10+, macOS 10.15+, или современный Linux дистрибутив\n")
-        f.write("- 4 ГБ ОЗУ (рекомендуется 8 ГБ)\n")
-        f.write("- 500 МБ свободного места на диске\n\n")
+SHA-256 контрольные суммы доступны в файле `checksums.txt`
 
-        f.write(
-            "Подробную информацию смотрите в [RELEASE_NOTES.md](link-to-release-notes)\n"
-        )
+## Что нового
+
+- Первый публичный релиз
+- Поддержка Windows, macOS и Linux
+
+## Системные требования
+
+- Windows 10+, macOS 10.15+, или современный Linux дистрибутив
+- 4 ГБ ОЗУ (рекомендуется 8 ГБ)
+- 500 МБ свободного места на диске
+
+Подробную информацию смотрите в [RELEASE_NOTES.md](link-to-release-notes)
+"""
+
+    (release_dir / "GITHUB_RELEASE_TEMPLATE.md").write_text(content, encoding="utf-8")
 
 
 def main():
@@ -46,6 +46,63 @@ def test_components():
         print(f"❌ Other error: {e}")
         return False
 
+def test_tray_menu_connections():
+    """Test that every menu and tray action emits its signal exactly once."""
+    try:
+        from PyQt6.QtWidgets import QApplication, QMainWindow
+        from interview_corvus.ui.components.menu_manager import MenuManager
+        
+        app = QApplication.instance() or QApplication([])
+        window = QMainWindow()
+        menu_manager = MenuManager(window)
+        menu_manager.create_menu_bar()
+        menu_manager.create_system_tray()
+        
+        # Build the lazily populated tray menu as if it had been opened
+        menu_manager._populate_tray_menu()
+        
+        signal_names = {
+            "Show/Hide": "toggle_visibility_triggered",
+            "Optimize Solution": "optimize_solution_triggered",
+            "Always on Top": "toggle_always_on_top_triggered",
+            "Reset All": "reset_history_triggered",
+            "Quit": "close_app_triggered",
+        }
+        tray_actions = [
+            (action, signal_names[action.text()])
+            for action in menu_manager.tray_menu.actions()
+            if not action.isSeparator()
+        ]
+        assert len(tray_actions) == len(signal_names), "❌ Unexpected tray menu actions"
+        
+        # Menu bar actions must not pick up extra connections from the tray menu
+        menu_bar_actions = [
+            (menu_manager.take_screenshot_action, "take_screenshot_triggered"),
+            (menu_manager.generate_solution_action, "generate_solution_triggered"),
+            (menu_manager.optimize_solution_action, "optimize_solution_triggered"),
+            (menu_manager.reset_history_action, "reset_history_triggered"),
+            (menu_manager.toggle_visibility_action, "toggle_visibility_triggered"),
+        ]
+        
+        for action, signal_name in tray_actions + menu_bar_actions:
+            emitted = []
+            signal = getattr(menu_manager, signal_name)
+            slot = lambda *args: emitted.append(args)
+            signal.connect(slot)
+            action.trigger()
+            signal.disconnect(slot)
+            assert len(emitted) == 1, (
+                f"❌ '{action.text()}' emitted {signal_name} {len(emitted)} times"
+            )
+        print("✅ Menu and tray actions each emit their signal once")
+        
+        menu_manager.tray_icon.hide()
+        return True
+        
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        return False
+
 if __name__ == "__main__":
-    success = test_components()
+    success = test_components() and test_tray_menu_connections()
     sys.exit(0 if success else 1)
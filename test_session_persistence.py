@@ -19,8 +19,9 @@ def test_session_persistence():
         from interview_corvus.invisibility.invisibility_manager import InvisibilityManager
         from PyQt6.QtWidgets import QApplication
         
-        # Create a test application
-        app = QApplication([])
+        # Reuse the running application when there is one (e.g. under pytest-qt);
+        # Qt allows only one per process and creating it is the slow part
+        app = QApplication.instance() or QApplication([])
         
         # Create managers
         invisibility_manager = InvisibilityManager()
@@ -29,16 +30,19 @@ def test_session_persistence():
         # Create main window
         window = MainWindow(invisibility_manager, hotkey_manager)
         
+        # Session state lives on the content display
+        display = window.content_display
+        
         # Test session data initialization
-        assert hasattr(window, 'current_session'), "❌ current_session not initialized"
-        assert window.current_session['code'] == "", "❌ code not initialized as empty"
-        assert window.current_session['explanation'] == "", "❌ explanation not initialized as empty"
+        assert hasattr(display, 'current_session'), "❌ current_session not initialized"
+        assert display.current_session['code'] == "", "❌ code not initialized as empty"
+        assert display.current_session['explanation'] == "", "❌ explanation not initialized as empty"
         print("✅ Session data structure initialized correctly")
         
         # Test session save/restore methods
-        assert hasattr(window, 'save_session_data'), "❌ save_session_data method missing"
-        assert hasattr(window, 'restore_session_data'), "❌ restore_session_data method missing"
-        assert hasattr(window, 'clear_session_data'), "❌ clear_session_data method missing"
+        assert hasattr(display, 'save_session_data'), "❌ save_session_data method missing"
+        assert hasattr(display, 'restore_session_data'), "❌ restore_session_data method missing"
+        assert hasattr(display, 'clear_session_data'), "❌ clear_session_data method missing"
         print("✅ Session management methods present")
         
         # Test manual session data persistence
@@ -48,33 +52,33 @@ def test_session_persistence():
         test_space_complexity = "O(1)"
         
         # Set test data in UI
-        window.code_editor.setPlainText(test_code)
-        window.explanation_text.setMarkdown(test_explanation)
-        window.time_complexity.setText(test_time_complexity)
-        window.space_complexity.setText(test_space_complexity)
+        display.code_editor.setPlainText(test_code)
+        display.explanation_text.setMarkdown(test_explanation)
+        display.time_complexity.setText(test_time_complexity)
+        display.space_complexity.setText(test_space_complexity)
         
         # Save session data
-        window.save_session_data()
+        display.save_session_data()
         
         # Verify session data was saved
-        assert window.current_session['code'] == test_code, "❌ Code not saved to session"
-        assert window.current_session['explanation'] == test_explanation, "❌ Explanation not saved to session"
-        assert window.current_session['time_complexity'] == test_time_complexity, "❌ Time complexity not saved to session"
-        assert window.current_session['space_complexity'] == test_space_complexity, "❌ Space complexity not saved to session"
+        assert display.current_session['code'] == test_code, "❌ Code not saved to session"
+        assert display.current_session['explanation'].strip() == test_explanation, "❌ Explanation not saved to session"
+        assert display.current_session['time_complexity'] == test_time_complexity, "❌ Time complexity not saved to session"
+        assert display.current_session['space_complexity'] == test_space_complexity, "❌ Space complexity not saved to session"
         print("✅ Session data saved correctly")
         
-        # Clear UI
-        window.clear_session_data()
+        # Clear UI (clear_content also resets the session)
+        display.clear_content()
         
         # Verify UI was cleared
-        assert window.code_editor.toPlainText() == "", "❌ Code editor not cleared"
-        assert window.explanation_text.toMarkdown() == "", "❌ Explanation not cleared"
-        assert window.time_complexity.text() == "N/A", "❌ Time complexity not reset"
-        assert window.space_complexity.text() == "N/A", "❌ Space complexity not reset"
+        assert display.code_editor.toPlainText() == "", "❌ Code editor not cleared"
+        assert display.explanation_text.toMarkdown().strip() == "", "❌ Explanation not cleared"
+        assert display.time_complexity.text() == "N/A", "❌ Time complexity not reset"
+        assert display.space_complexity.text() == "N/A", "❌ Space complexity not reset"
         print("✅ Session data and UI cleared correctly")
         
         # Restore from saved session (simulate by manually setting session data)
-        window.current_session = {
+        display.current_session = {
             'code': test_code,
             'explanation': test_explanation,
             'time_complexity': test_time_complexity,
@@ -82,18 +86,29 @@ def test_session_persistence():
             'is_optimized': False
         }
         
-        window.restore_session_data()
+        display.restore_session_data()
         
         # Verify data was restored
-        assert window.code_editor.toPlainText() == test_code, "❌ Code not restored from session"
-        assert window.explanation_text.toMarkdown() == test_explanation, "❌ Explanation not restored from session"
-        assert window.time_complexity.text() == test_time_complexity, "❌ Time complexity not restored from session"
-        assert window.space_complexity.text() == test_space_complexity, "❌ Space complexity not restored from session"
+        assert display.code_editor.toPlainText() == test_code, "❌ Code not restored from session"
+        assert display.explanation_text.toMarkdown().strip() == test_explanation, "❌ Explanation not restored from session"
+        assert display.time_complexity.text() == test_time_complexity, "❌ Time complexity not restored from session"
+        assert display.space_complexity.text() == test_space_complexity, "❌ Space complexity not restored from session"
         print("✅ Session data restored correctly")
         
-        # Test auto-save timer
-        assert hasattr(window, 'session_save_timer'), "❌ Auto-save timer not initialized"
-        print("✅ Auto-save timer initialized")
+        # Test change-driven session saving
+        assert window._resize_save_timer.isSingleShot(), "❌ Session save timer is not single-shot"
+        window._save_session_data()
+        assert not window._session_dirty, "❌ Session dirty without a code change"
+        
+        # An edit to the editor itself (not a displayed solution) marks the session dirty
+        edited_code = "print('Edited')"
+        display.code_editor.setPlainText(edited_code)
+        assert window._session_dirty, "❌ Code change did not mark the session dirty"
+        
+        window._save_session_data()
+        assert not window._session_dirty, "❌ Session still dirty after saving"
+        assert display.current_session['code'] == edited_code, "❌ Edited code not saved to session"
+        print("✅ Session saving is change-driven")
         
         # Clean up
         app.quit()
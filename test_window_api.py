@@ -4,62 +4,93 @@ Test script for the window control API endpoints.
 Run this after starting the GUI application to test window visibility control.
 """
 
-import requests
-import time
+import argparse
 import json
+import sys
+import time
+
+import requests
 
 API_BASE = "http://127.0.0.1:8000"
+# (connect, read) seconds; a local server that isn't listening fails at once
+TIMEOUT = (0.5, 5.0)
+
+# (method, endpoint, description, seconds to wait afterwards), run in order
+WINDOW_PROBES = (
+    ("POST", "/window/hide", "Hide window", 2),
+    ("POST", "/window/show", "Show window", 2),
+    ("POST", "/window/toggle", "Toggle window visibility", 2),
+    ("POST", "/window/toggle", "Toggle window visibility again", 0),
+)
 
-def test_endpoint(method, endpoint, description):
-    """Test an API endpoint and print the result."""
-    print(f"\n🧪 Testing: {description}")
-    print(f"   {method} {API_BASE}{endpoint}")
+def prepare(session, method, endpoint):
+    """Build a request once so sending it skips URL parsing and header merging."""
+    return session.prepare_request(requests.Request(method, f"{API_BASE}{endpoint}"))
+
+def test_endpoint(session, request, description, pretty=False):
+    """Send a prepared API request and print the result."""
+    response = session.send(request, timeout=TIMEOUT)
     
-    try:
-        if method == "GET":
-            response = requests.get(f"{API_BASE}{endpoint}")
-        elif method == "POST":
-            response = requests.post(f"{API_BASE}{endpoint}")
-        elif method == "DELETE":
-            response = requests.delete(f"{API_BASE}{endpoint}")
-        
-        print(f"   Status: {response.status_code}")
-        if response.headers.get('content-type', '').startswith('application/json'):
-            result = response.json()
-            print(f"   Response: {json.dumps(result, indent=2)}")
-        else:
-            print(f"   Response: {response.text}")
-            
-    except requests.exceptions.ConnectionError:
-        print("   ❌ Connection failed - make sure the GUI application is running!")
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
+    # The body is already JSON text; only re-encode it when asked to indent
+    if pretty and response.headers.get('content-type', '').startswith('application/json'):
+        body = json.dumps(response.json(), indent=2)
+    else:
+        body = response.text
+    
+    # One write per probe instead of a print per line
+    sys.stdout.write(
+        f"\n🧪 Testing: {description}\n"
+        f"   {request.method} {request.url}\n"
+        f"   Status: {response.status_code}\n"
+        f"   Response: {body}\n"
+    )
 
 def main():
     """Test all window control endpoints."""
+    parser = argparse.ArgumentParser(description="Test the window control API endpoints.")
+    parser.add_argument("--pretty", action="store_true", help="Indent JSON responses")
+    args = parser.parse_args()
+    
     print("🎯 Interview Corvus Window Control API Test")
     print("=" * 50)
     
-    # Test health check first
-    test_endpoint("GET", "/health", "Health check")
+    # One keep-alive connection for all probes
+    session = requests.Session()
+    
+    # Test health check first; if the app isn't reachable there is no point
+    # in sending the rest
+    try:
+        test_endpoint(session, prepare(session, "GET", "/health"), "Health check", args.pretty)
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+        print(f"\n❌ Connection to {API_BASE} failed - make sure the GUI application is running!")
+        session.close()
+        sys.exit(1)
     
     print("\n" + "=" * 50)
     print("🪟 Testing Window Control APIs")
     print("=" * 50)
     
     # Test window controls
-    test_endpoint("POST", "/window/hide", "Hide window")
-    time.sleep(2)  # Wait 2 seconds
-    
-    test_endpoint("POST", "/window/show", "Show window")
-    time.sleep(2)  # Wait 2 seconds
-    
-    test_endpoint("POST", "/window/toggle", "Toggle window visibility")
-    time.sleep(2)  # Wait 2 seconds
-    
-    test_endpoint("POST", "/window/toggle", "Toggle window visibility again")
+    requests_to_send = [
+        prepare(session, method, endpoint) for method, endpoint, _, _ in WINDOW_PROBES
+    ]
+    failures = 0
+    try:
+        for request, (_, _, description, wait) in zip(requests_to_send, WINDOW_PROBES):
+            try:
+                test_endpoint(session, request, description, args.pretty)
+            except requests.exceptions.RequestException as e:
+                failures += 1
+                print(f"\n❌ {description} ({request.method} {request.url}) failed: {e}")
+            if wait:
+                time.sleep(wait)  # Give the window time to change visibly
+    finally:
+        session.close()
     
     print("\n" + "=" * 50)
+    if failures:
+        print(f"❌ {failures} of {len(WINDOW_PROBES)} window control API tests failed")
+        sys.exit(1)
     print("✅ Window control API tests completed!")
     print("💡 You can also test these endpoints manually:")
     print(f"   curl -X POST {API_BASE}/window/hide")